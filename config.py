@@ -20,7 +20,6 @@ class Colors:
     PURPLE = (128, 0, 128)       # Alternative color
     
     # Weather icon palette (0-9 indices for multi-color icons)
-    # Note: Full palette defined in display/weather_icons.py
     WEATHER_PALETTE = {
         0: (0, 0, 0),         # Black/transparent (off)
         1: (255, 255, 255),   # White (clouds, snow)
@@ -153,4 +152,15 @@ class Hardware:
     ROWS = 64
     COLS = 64
     CHAIN_LENGTH = 1
-    PARALLEL = 1
\ No newline at end of file
+    PARALLEL = 1
+
+# Module-level aliases for layout values read on every frame. The classes above
+# remain the source of truth; these exist so the render loop can use a plain
+# global lookup instead of a class attribute lookup.
+HEADLINES_START_Y = Layout.HEADLINES_START_Y
+HEADLINES_HEIGHT = Layout.HEADLINES_HEIGHT
+HEADLINES_WIDTH = Layout.HEADLINES_WIDTH
+
+# Weather palette flattened to R,G,B bytes in digit order (0-9): the palette
+# display/weather_icons.py attaches with putpalette() to color each icon
+WEATHER_PALETTE_RGB = bytes(c for i in range(10) for c in Colors.WEATHER_PALETTE[i])
@@ -3,13 +3,41 @@
 import threading
 import time
 import queue
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from .time_provider import get_time_provider
 from .weather_provider import get_weather_provider
 from .stock_provider import get_stock_provider
 from .news_provider import get_news_provider
 
+# Read-only defaults served until the first successful fetch of each data type
+_DEFAULT_WEATHER = MappingProxyType({
+    "high_low_text": "H-- L--",
+    "current_text": "Now --",
+    "current": 0,
+    "high": 0,
+    "low": 0,
+    "timestamp": 0
+})
+
+_DEFAULT_STOCKS = MappingProxyType({
+    "dow_text": "DOW+0",
+    "sp_text": "S&P+0",
+    "nasdaq_text": "NASDAQ+0",
+    "dow_change": 0,
+    "sp_change": 0,
+    "nasdaq_change": 0,
+    "timestamp": 0
+})
+
+_DEFAULT_NEWS = MappingProxyType({
+    "headlines": ("Loading news...",),
+    "count": 1,
+    "timestamp": 0
+})
+
 class ThreadedDataManager:
     """Manages data fetching in background threads to prevent blocking the display"""
     
@@ -22,18 +50,24 @@ class ThreadedDataManager:
         self.stock_provider = get_stock_provider()
         self.news_provider = get_news_provider()
         
-        # Current data (thread-safe access)
-        self._data_lock = threading.Lock()
-        self._current_data = {
-            'time': {},
-            'weather': {},
-            'stocks': {},
-            'news': {}
-        }
+        # Current data, published as plain attribute references
+        # Each dict is replaced wholesale by the fetch thread and never mutated
+        # after publication. Attribute assignment is atomic under the GIL, so
+        # readers need no lock and never wait on a slow fetch.
+        self._weather_data: Optional[Mapping[str, Any]] = None
+        self._stock_data: Optional[Dict[str, Any]] = None
+        self._news_data: Optional[Dict[str, Any]] = None
+        
+        # Headline text -> string object from the previous refresh, so unchanged
+        # headlines keep their identity and compare by pointer downstream
+        self._headline_intern: Dict[str, str] = {}
         
         # Background thread
         self._data_thread = None
         
+        # Set to wake the background thread early (forced update or shutdown)
+        self._wake_event = threading.Event()
+        
         # Update intervals (in seconds)
         self.weather_check_interval = 60   # Check weather every minute
         self.stock_check_interval = 360    # Check stocks every 6 minutes
@@ -57,6 +91,7 @@ class ThreadedDataManager:
     def stop(self):
         """Stop the background data fetching thread"""
         self.running = False
+        self._wake_event.set()
         if self._data_thread:
             self._data_thread.join(timeout=5)
         print("Data manager stopped")
@@ -88,24 +123,33 @@ class ThreadedDataManager:
             except Exception as e:
                 print(f"Error in data fetch loop: {e}")
             
-            # Sleep for a short time before next check
-            time.sleep(5)  # Check every 5 seconds
+            # Sleep until the next update is due, or until woken early
+            next_due = min(
+                self._last_weather_update + self.weather_check_interval,
+                self._last_stock_update + self.stock_check_interval,
+                self._last_news_update + self.news_check_interval
+            )
+            self._wake_event.wait(max(0, next_due - time.time()))
+            self._wake_event.clear()
     
     def _fetch_all_data(self):
         """Fetch all data types (used for initial load)"""
         print("Fetching initial data...")
-        self._fetch_weather_data()
-        self._fetch_stock_data()
-        self._fetch_news_data()
+        # The sources are independent, so fetch them concurrently - the cold
+        # start takes as long as the slowest source rather than their sum.
+        # Each _fetch_* method handles its own errors and publishes its result.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            executor.submit(self._fetch_weather_data)
+            executor.submit(self._fetch_stock_data)
+            executor.submit(self._fetch_news_data)
     
     def _fetch_weather_data(self):
         """Fetch weather data in background thread"""
         try:
             weather_data = self.weather_provider.get_data()
             
-            with self._data_lock:
-                self._current_data['weather'] = weather_data
-                
+            self._weather_data = weather_data
+            
             print(f"Weather updated: {weather_data.get('current_text', 'Unknown')}")
             
         except Exception as e:
@@ -116,9 +160,8 @@ class ThreadedDataManager:
         try:
             stock_data = self.stock_provider.get_data()
             
-            with self._data_lock:
-                self._current_data['stocks'] = stock_data
-                
+            self._stock_data = stock_data
+            
             dow_text = stock_data.get('dow_text', 'DOW+0')
             print(f"Stocks updated: {dow_text}")
             
@@ -130,9 +173,19 @@ class ThreadedDataManager:
         try:
             news_data = self.news_provider.get_data()
             
-            with self._data_lock:
-                self._current_data['news'] = news_data
-                
+            # Reuse string objects for headlines carried over from the last refresh
+            previous = self._headline_intern
+            interned: Dict[str, str] = {}
+            headlines = []
+            for headline in news_data.get('headlines', []):
+                headline = previous.get(headline, headline)
+                interned[headline] = headline
+                headlines.append(headline)
+            news_data['headlines'] = headlines
+            self._headline_intern = interned
+            
+            self._news_data = news_data
+            
             headline_count = news_data.get('count', 0)
             print(f"News updated: {headline_count} headlines")
             
@@ -165,63 +218,32 @@ class ThreadedDataManager:
         """Get just time data (always fresh)"""
         return self.time_provider.get_data()
     
-    def get_weather_data(self) -> Dict[str, Any]:
-        """Get cached weather data (thread-safe), always returns a valid dict"""
-        with self._data_lock:
-            if self._current_data['weather']:
-                return self._current_data['weather'].copy()
-            else:
-                # Return default weather data if none cached
-                return {
-                    "high_low_text": "H-- L--",
-                    "current_text": "Now --",
-                    "current": 0,
-                    "high": 0,
-                    "low": 0,
-                    "timestamp": 0
-                }
+    def get_weather_data(self) -> Mapping[str, Any]:
+        """Get cached weather data (lock-free), always returns a valid dict (treat as read-only)"""
+        return self._weather_data or _DEFAULT_WEATHER
     
-    def get_stock_data(self) -> Dict[str, Any]:
-        """Get cached stock data (thread-safe), always returns a valid dict"""
-        with self._data_lock:
-            if self._current_data['stocks']:
-                return self._current_data['stocks'].copy()
-            else:
-                # Return default stock data if none cached
-                return {
-                    "dow_text": "DOW+0",
-                    "sp_text": "S&P+0",
-                    "nasdaq_text": "NASDAQ+0",
-                    "dow_change": 0,
-                    "sp_change": 0,
-                    "nasdaq_change": 0,
-                    "timestamp": 0
-                }
+    def get_stock_data(self) -> Mapping[str, Any]:
+        """Get cached stock data (lock-free), always returns a valid dict (treat as read-only)"""
+        return self._stock_data or _DEFAULT_STOCKS
     
-    def get_news_data(self) -> Dict[str, Any]:
-        """Get cached news data (thread-safe), always returns a valid dict"""
-        with self._data_lock:
-            if self._current_data['news']:
-                return self._current_data['news'].copy()
-            else:
-                # Return default news data if none cached
-                return {
-                    "headlines": ["Loading news..."],
-                    "count": 1,
-                    "timestamp": 0
-                }
+    def get_news_data(self) -> Mapping[str, Any]:
+        """Get cached news data (lock-free), always returns a valid dict (treat as read-only)"""
+        return self._news_data or _DEFAULT_NEWS
     
     def force_update_weather(self):
         """Force immediate weather update (non-blocking)"""
         self._last_weather_update = 0  # Reset timer to trigger update
+        self._wake_event.set()
     
     def force_update_stocks(self):
         """Force immediate stock update (non-blocking)"""
         self._last_stock_update = 0  # Reset timer to trigger update
+        self._wake_event.set()
     
     def force_update_news(self):
         """Force immediate news update (non-blocking)"""
         self._last_news_update = 0  # Reset timer to trigger update
+        self._wake_event.set()
 
 # Global instance
 _data_manager = None
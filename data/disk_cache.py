@@ -0,0 +1,84 @@
+# data/disk_cache.py - Persists provider caches across restarts
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+# Per-user cache directory, so no other local user can pre-create or
+# symlink the cache files (as they could under a shared /tmp)
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "led-clock"
+)
+
+def cache_path(filename: str) -> str:
+    """
+    Get the path of a cache file inside CACHE_DIR
+    
+    Args:
+        filename: Cache file name, e.g. "weather.json"
+        
+    Returns:
+        Absolute path of the cache file (the directory is created on first save)
+    """
+    return os.path.join(CACHE_DIR, filename)
+
+def _encode(value: Any) -> Any:
+    """JSON fallback encoder - datetimes are stored as ISO strings"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def load_cache(path: str, max_age: float) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached data dict written by save_cache
+    
+    Args:
+        path: Cache file path
+        max_age: Maximum age in seconds, measured from the dict's "timestamp"
+        
+    Returns:
+        The cached dict, or None if missing, unreadable or too old
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        age = time.time() - data["timestamp"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if 0 <= age < max_age:
+        return data
+    return None
+
+def save_cache(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a data dict to disk atomically
+    
+    The dict is written to a uniquely named temporary file in the target's
+    directory (created private to this user if missing) and renamed over the
+    target, so a crash mid-write never leaves a truncated cache behind.
+    
+    Args:
+        path: Cache file path
+        data: Dict with a wall-clock "timestamp" key (datetimes are stored as ISO strings)
+    """
+    tmp_path = None
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, default=_encode)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error saving cache to {path}: {e}")
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
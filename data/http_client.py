@@ -0,0 +1,101 @@
+# data/http_client.py - Shared keep-alive HTTP client for the data providers
+
+import gzip
+import json
+import threading
+import urllib.request
+from typing import Any, Optional
+
+# Optional fast JSON decoder (falls back to the stdlib json module)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# requests (optional, enables connection pooling) is imported on first use
+# rather than at module load - it pulls in urllib3/certifi/charset_normalizer,
+# which slows startup on the Pi
+_requests = None
+_requests_checked = False
+
+_USER_AGENT = "Mozilla/5.0"
+
+# API hosts the shared session talks to (Open-Meteo and Financial Modeling Prep)
+_POOL_HOSTS = 2
+# Most simultaneous requests to one host (stock quotes are fetched in parallel)
+_POOL_MAXSIZE = 2
+
+def import_requests():
+    """Import the requests library on first use; returns None if not installed"""
+    global _requests, _requests_checked
+    if not _requests_checked:
+        try:
+            import requests
+            _requests = requests
+        except ImportError:
+            _requests = None
+        _requests_checked = True
+    return _requests
+
+# Global session shared by the stock and weather providers
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """
+    Get the shared requests session, creating it on first use
+    
+    Reusing one session keeps connections to each API host alive between
+    polls, so only the first request pays the TCP+TLS handshake.
+    
+    Returns:
+        requests.Session, or None if requests is not installed
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            requests = import_requests()
+            if requests is not None:
+                _session = requests.Session()
+                _session.headers.update({"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"})
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=_POOL_HOSTS, pool_maxsize=_POOL_MAXSIZE
+                )
+                _session.mount('https://', adapter)
+        return _session
+
+def get_json(url: str, timeout: float = 10) -> Any:
+    """
+    Fetch a URL and decode its JSON body
+    
+    Uses the shared keep-alive session when requests is installed, urllib otherwise.
+    The body is decoded with orjson when available.
+    
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Decoded JSON data
+        
+    Raises:
+        Exception: On network, HTTP status or JSON decode errors
+    """
+    session = get_session()
+    if session is not None:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        if HAS_ORJSON:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        body = resp.read()
+        # urllib doesn't decompress on its own
+        if resp.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+    if HAS_ORJSON:
+        return orjson.loads(body)
+    return json.loads(body)
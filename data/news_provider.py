@@ -1,20 +1,46 @@
 # data/news_provider.py - RSS news provider for scrolling headlines
 
+import re
 import time
+import gzip
+import hashlib
+import threading
 import urllib.request
-import subprocess
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import xml.etree.ElementTree as ET
 from urllib import request as urllib_request
 from urllib import error as urllib_error
-from typing import Dict, Any, List, Optional, Tuple
+from io import BytesIO
+from typing import Dict, Any, List, Optional, Tuple, Iterator
 from html import unescape
 
-# Try to import requests library for better compatibility
+from .http_client import import_requests
+
+# Try to import lxml for fast streaming XML parsing (falls back to ElementTree)
 try:
-    import requests
-    HAS_REQUESTS = True
+    from lxml import etree as LET
+    HAS_LXML = True
 except ImportError:
-    HAS_REQUESTS = False
+    HAS_LXML = False
+
+# Browser User-Agent - some feeds reject the default Python one
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Headers for the requests session (requests decodes gzip and deflate itself)
+_SESSION_HEADERS = MappingProxyType({'User-Agent': _USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+
+# Headers for the urllib fallback (gzip only, decompressed manually)
+_URLLIB_HEADERS = MappingProxyType({'User-Agent': _USER_AGENT, 'Accept-Encoding': 'gzip'})
+
+# Atom feeds use <entry> elements in this namespace instead of RSS <item>
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_ATOM_ENTRY = _ATOM_NS + 'entry'
+_ATOM_TITLE = _ATOM_NS + 'title'
+
+# Matches a CDATA wrapper left in title text by feeds that double-escape it
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.S)
 
 class NewsProvider:
     """Provides news headlines from RSS feeds for scrolling display"""
@@ -22,8 +48,6 @@ class NewsProvider:
     def __init__(self):
         """Initialize news provider with conservative RSS sources"""
         # Store sources with friendly names for logging
-        # Newsmax uses curl due to compatibility issues with Python requests
-        # Placed first to avoid network contention issues
         self.rss_sources = [
 #            ("Newsmax", "https://www.newsmax.com/rss/Newsfront/16/"),
             ("Fox News", "https://feeds.foxnews.com/foxnews/latest"),
@@ -34,113 +58,253 @@ class NewsProvider:
             ("Washington Examiner", "https://www.washingtonexaminer.com/feed")
         ]
         
+        # Per-source fetch settings, resolved once: (name, url, timeout)
+        # Newsmax is slow to respond and gets a longer timeout
+        self._sources = [
+            (name, url, self._timeout_for(url)) for name, url in self.rss_sources
+        ]
+        
         self.last_update = 0
         self.cached_headlines = []
         self.update_interval = 1800  # 30 minutes
         self.max_headlines = 200      # Limit number of headlines
         self.max_headline_length = 200  # Max characters per headline
+        self._truncate_at = self.max_headline_length - 3  # Leave room for "..."
+        
+        # Conditional GET cache: url -> (etag, last_modified, headlines)
+        # Lets unchanged feeds answer with a tiny 304 instead of the full body
+        self._feed_cache: Dict[str, Tuple[Optional[str], Optional[str], List[str]]] = {}
         
-    def fetch_rss_headlines(self, source_name: str, rss_url: str) -> Tuple[List[str], int]:
+        # Small LRU of parsed headlines keyed by a hash of the feed body, so
+        # identical XML (e.g. mirrored feeds) is only parsed once
+        self._parse_cache: 'OrderedDict[bytes, List[str]]' = OrderedDict()
+        self._parse_cache_size = 16
+        self._parse_cache_lock = threading.Lock()  # Feeds are fetched concurrently
+        
+        # Shared HTTP session so feed connections are kept alive between refreshes
+        # Transport strategy (requests or urllib) is picked by _get_downloader
+        self._session = None
+        self._download = None
+        self._download_lock = threading.Lock()
+        
+    @staticmethod
+    def _timeout_for(rss_url: str) -> int:
+        """Request timeout in seconds for a feed URL (Newsmax needs longer)"""
+        return 30 if 'newsmax' in rss_url.lower() else 15
+    
+    def _get_downloader(self):
+        """
+        Get the download strategy for feeds, choosing it on first use
+        
+        Uses a pooled requests session when requests is installed (one kept-alive
+        connection per source, gzip-compressed responses), urllib otherwise.
+        
+        Returns:
+            Bound download method taking (rss_url, extra_headers, timeout)
+        """
+        with self._download_lock:
+            if self._download is None:
+                requests = import_requests()
+                if requests is not None:
+                    session = requests.Session()
+                    session.headers.update(_SESSION_HEADERS)
+                    pool_size = len(self.rss_sources)
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=pool_size, pool_maxsize=pool_size
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+                    self._download = self._download_with_requests
+                else:
+                    self._download = self._download_with_urllib
+            return self._download
+    
+    def _download_with_requests(self, rss_url: str, extra_headers: Dict[str, str],
+                                timeout: int) -> Optional[Tuple[bytes, Any]]:
+        """
+        Download a feed with the pooled requests session
+        
+        Returns:
+            Tuple of (body bytes, response headers), or None on 304 Not Modified
+        """
+        response = self._session.get(rss_url, headers=extra_headers, timeout=timeout)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        return response.content, response.headers
+    
+    def _download_with_urllib(self, rss_url: str, extra_headers: Dict[str, str],
+                              timeout: int) -> Optional[Tuple[bytes, Any]]:
+        """
+        Download a feed with urllib (used when requests is not installed)
+        
+        Returns:
+            Tuple of (body bytes, response headers), or None on 304 Not Modified
+        """
+        req = urllib.request.Request(rss_url, headers={**_URLLIB_HEADERS, **extra_headers})
+        
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                xml_data = response.read()
+                response_headers = response.headers
+        except urllib_error.HTTPError as e:
+            # urllib reports 304 Not Modified as an error
+            if e.code == 304:
+                return None
+            raise
+        
+        # urllib does not decompress for us
+        if response_headers.get('Content-Encoding') == 'gzip':
+            xml_data = gzip.decompress(xml_data)
+        return xml_data, response_headers
+    
+    def _iter_item_titles(self, source_name: str, xml_data: bytes) -> Iterator[Optional[str]]:
+        """
+        Yield the raw <title> text of each <item> (RSS) or <entry> (Atom)
+        
+        Uses lxml's streaming iterparse when available so the full tree is never
+        built; otherwise parses with ElementTree.
+        
+        Args:
+            source_name: Friendly name of the source (for logging)
+            xml_data: Raw RSS bytes
+            
+        Yields:
+            Title text for each item (None if the item has no title)
+        """
+        if HAS_LXML:
+            for _, item in LET.iterparse(BytesIO(xml_data), tag=('item', _ATOM_ENTRY), recover=True):
+                if item.tag == 'item':
+                    yield item.findtext('title')
+                else:
+                    yield item.findtext(_ATOM_TITLE)
+                # Free the item subtree once its title has been read
+                item.clear()
+            return
+        
+        # Parse XML with error recovery
+        try:
+            # Try standard parsing first
+            root = ET.fromstring(xml_data)
+        except ET.ParseError as e:
+            try:
+                # Parse what we can, ignoring errors
+                parser = ET.XMLParser(encoding='utf-8')
+                root = ET.fromstring(xml_data, parser=parser)
+            except:
+                print(f"Could not parse XML from {source_name} even with recovery: {e}")
+                return
+        
+        # Find all item elements (works for most RSS formats)
+        for item in root.findall('.//item'):
+            yield item.findtext('title')
+        
+        # Atom feeds
+        for entry in root.iter(_ATOM_ENTRY):
+            yield entry.findtext(_ATOM_TITLE)
+    
+    def _parse_headlines(self, source_name: str, xml_data: bytes) -> List[str]:
+        """
+        Extract cleaned-up headline strings from RSS bytes
+        
+        Args:
+            source_name: Friendly name of the source (for logging)
+            xml_data: Raw RSS bytes
+            
+        Returns:
+            List of up to 50 headline strings
+        """
+        headlines = []
+        
+        # Walk <item> titles, stopping as soon as we have enough headlines
+        for title_text in self._iter_item_titles(source_name, xml_data):
+            if title_text:
+                # Clean up the title - handle CDATA and HTML entities
+                title = title_text.strip()
+                
+                # Remove CDATA markers if present
+                if '<' in title:
+                    title = _CDATA_RE.sub(r'\1', title)
+                
+                # Unescape HTML entities
+                title = unescape(title.strip())
+                
+                # Truncate if too long
+                if len(title) > self.max_headline_length:
+                    title = title[:self._truncate_at] + "..."
+                
+                headlines.append(title)
+                
+                # Limit headlines per source
+                if len(headlines) >= 50:
+                    break
+        
+        return headlines
+    
+    def fetch_rss_headlines(self, source_name: str, rss_url: str,
+                            timeout: Optional[int] = None) -> Tuple[List[str], int]:
         """
         Fetch headlines from a single RSS feed
         
         Args:
             source_name: Friendly name of the source
             rss_url: URL of the RSS feed
+            timeout: Request timeout in seconds (default: based on the URL)
             
         Returns:
             Tuple of (list of headline strings, count fetched)
         """
-        headlines = []
+        if timeout is None:
+            timeout = self._timeout_for(rss_url)
         
-        # Use curl for Newsmax, requests for others if available, urllib as fallback
-        use_curl = 'newsmax' in rss_url.lower()
-        use_requests = HAS_REQUESTS and not use_curl
+        # Ask the server to skip the body if the feed hasn't changed
+        conditional_headers = {}
+        cached = self._feed_cache.get(rss_url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+        
+        download = self._get_downloader()
         
         try:
-            if use_curl:
-                # Use curl subprocess for sites that block Python requests
-                # Force HTTP/1.1 to avoid HTTP/2 connection issues
-                result = subprocess.run(
-                    ['curl', '-s', '--http1.1', '-A', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36', rss_url],
-                    capture_output=True,
-                    timeout=30,  # Newsmax needs longer timeout
-                    text=False  # Get bytes, not string
-                )
-                
-                if result.returncode != 0:
-                    print(f"Curl failed for {source_name} with return code {result.returncode}")
-                    return [], 0
-                
-                xml_data = result.stdout
-                
-            elif use_requests:
-                # Use requests library for better compatibility
-                response = requests.get(
-                    rss_url,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    },
-                    timeout=15
-                )
-                response.raise_for_status()
-                xml_data = response.content
-            else:
-                # Use urllib for other feeds
-                req = urllib.request.Request(
-                    rss_url,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                )
-                
-                timeout = 15
-                with urllib.request.urlopen(req, timeout=timeout) as response:
-                    xml_data = response.read()
+            result = download(rss_url, conditional_headers, timeout)
+            if result is None:
+                # 304 Not Modified - reuse the headlines parsed last time
+                if cached:
+                    return list(cached[2]), len(cached[2])
+                return [], 0
+            xml_data, response_headers = result
             
-            # Parse XML with error recovery
-            try:
-                # Try standard parsing first
-                root = ET.fromstring(xml_data)
-            except ET.ParseError as e:
-                # If parsing fails, try with recover mode using iterparse
-                from io import BytesIO
-                try:
-                    # Parse what we can, ignoring errors
-                    parser = ET.XMLParser(encoding='utf-8')
-                    root = ET.fromstring(xml_data, parser=parser)
-                except:
-                    print(f"Could not parse XML from {source_name} even with recovery: {e}")
-                    return [], 0
+            # Error pages (e.g. bot challenges) come back as HTML - skip the parse
+            if b'<item' not in xml_data and b'<entry' not in xml_data:
+                print(f"No RSS items found in response from {source_name}")
+                return [], 0
+            
+            # Reuse the parsed headlines if this exact body was seen recently
+            body_hash = hashlib.blake2b(xml_data, digest_size=16).digest()
+            with self._parse_cache_lock:
+                headlines = self._parse_cache.get(body_hash)
+                if headlines is not None:
+                    self._parse_cache.move_to_end(body_hash)
             
-            # Find all item elements (works for most RSS formats)
-            items = root.findall('.//item')
+            if headlines is None:
+                headlines = self._parse_headlines(source_name, xml_data)
+                with self._parse_cache_lock:
+                    self._parse_cache[body_hash] = headlines
+                    if len(self._parse_cache) > self._parse_cache_size:
+                        self._parse_cache.popitem(last=False)
             
-            for item in items:
-                # Get title
-                title_elem = item.find('title')
-                if title_elem is not None and title_elem.text:
-                    # Clean up the title - handle CDATA and HTML entities
-                    title = title_elem.text.strip()
-                    
-                    # Remove CDATA markers if present
-                    if title.startswith('<![CDATA['):
-                        title = title.replace('<![CDATA[', '').replace(']]>', '')
-                    
-                    # Unescape HTML entities
-                    title = unescape(title.strip())
-                    
-                    # Truncate if too long
-                    if len(title) > self.max_headline_length:
-                        title = title[:self.max_headline_length-3] + "..."
-                    
-                    headlines.append(title)
-                    
-                    # Limit headlines per source
-                    if len(headlines) >= 50:
-                        break
+            # Remember validators so the next refresh can be a conditional GET
+            etag = response_headers.get('ETag')
+            last_modified = response_headers.get('Last-Modified')
+            if headlines and (etag or last_modified):
+                self._feed_cache[rss_url] = (etag, last_modified, headlines)
             
-            return headlines, len(headlines)
+            return list(headlines), len(headlines)
             
         except urllib_error.URLError as e:
             if hasattr(e, 'reason'):
@@ -164,22 +328,40 @@ class NewsProvider:
         
         print("Fetching news headlines from RSS sources...")
         
-        for source_name, rss_url in self.rss_sources:
-            headlines, count = self.fetch_rss_headlines(source_name, rss_url)
+        # Fetch all sources concurrently - each request is I/O bound, so total
+        # latency is the slowest source instead of the sum of all of them
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(self.rss_sources)) as executor:
+            futures = {
+                executor.submit(self.fetch_rss_headlines, source_name, rss_url, timeout): source_name
+                for source_name, rss_url, timeout in self._sources
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Aggregate in configured source order so the strip order stays stable,
+        # skipping stories already carried by an earlier source
+        seen = set()
+        duplicates = 0
+        for source_name, _ in self.rss_sources:
+            headlines, count = results[source_name]
             
             if count > 0:
-                all_headlines.extend(headlines)
+                for headline in headlines:
+                    # Normalize case and truncation so near-identical titles match
+                    key = headline.casefold().rstrip('.… ')
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    all_headlines.append(headline)
                 source_counts.append(f"{source_name}: {count}")
             else:
                 source_counts.append(f"{source_name}: 0 (failed)")
-            
-            # Stop if we have enough headlines
-            if len(all_headlines) >= self.max_headlines:
-                break
         
         # Log summary
         total = len(all_headlines)
-        print(f"News fetch complete: {total} total headlines")
+        print(f"News fetch complete: {total} total headlines ({duplicates} duplicates skipped)")
         for source_info in source_counts:
             print(f"  - {source_info}")
         
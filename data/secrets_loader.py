@@ -0,0 +1,29 @@
+# data/secrets_loader.py - Loads secrets.json once per process
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Any
+
+@lru_cache(maxsize=1)
+def load_secrets() -> Dict[str, Any]:
+    """
+    Load secrets from secrets.json file
+    
+    The file is read and parsed once; later calls return the same dict,
+    so callers must treat it as read-only. Call load_secrets.cache_clear()
+    to pick up edits to secrets.json without restarting.
+    
+    Returns:
+        Dictionary of secrets
+        
+    Raises:
+        FileNotFoundError: If secrets.json doesn't exist
+        json.JSONDecodeError: If secrets.json is invalid
+    """
+    # Get the path to secrets.json (in project root, one level up from data/)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    secrets_path = os.path.join(current_dir, '..', 'secrets.json')
+    
+    with open(secrets_path, 'r') as f:
+        return json.load(f)
@@ -1,32 +1,42 @@
 # data/stock_provider.py - Provides stock market information from Financial Modeling Prep API
 
-import json
-import urllib.request
+import sys
 import time
-import os
+from datetime import datetime, timedelta, time as dt_time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
-def load_secrets() -> Dict[str, str]:
-    """
-    Load secrets from secrets.json file
-    
-    Returns:
-        Dictionary of secrets
-        
-    Raises:
-        FileNotFoundError: If secrets.json doesn't exist
-        json.JSONDecodeError: If secrets.json is invalid
-    """
-    # Get the path to secrets.json (in project root, one level up from data/)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    secrets_path = os.path.join(current_dir, '..', 'secrets.json')
-    
-    with open(secrets_path, 'r') as f:
-        return json.load(f)
+from .http_client import get_json
+from .secrets_loader import load_secrets
+from .disk_cache import cache_path, load_cache, save_cache
+from utils.rounding import round_half_away
+
+# Trading window (local time, weekdays)
+_MKT_OPEN = dt_time(9, 15)    # 9:15 AM
+_MKT_CLOSE = dt_time(16, 15)  # 4:15 PM
+
+# Last successful fetch, reused on restart while still fresh
+_CACHE_PATH = cache_path("stocks.json")
+
+# Placeholder shown until the first fetch (or fallback) fills cached_data
+_NO_STOCK_DATA = {
+    "dow": {"change": 0, "change_int": 0, "label": "DOW", "value": "0", "symbol": "^DJI"},
+    "sp": {"change": 0, "change_int": 0, "label": "S&P", "value": "0", "symbol": "^GSPC"},
+    "timestamp": 0
+}
+
+def _intern(value: Any) -> Any:
+    """Intern short display strings; they repeat across every refresh"""
+    return sys.intern(value) if isinstance(value, str) else value
 
 class StockProvider:
     """Provides stock market information for the LED clock display"""
     
+    # Long-lived singleton with a fixed attribute set - no per-instance __dict__
+    __slots__ = ('api_key', 'last_update', 'cached_data', '_display', 'update_interval',
+                 'startup_fetch_done', '_next_check_monotonic', 'api_url', 'symbols',
+                 '_urls')
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize stock provider
@@ -57,40 +67,81 @@ class StockProvider:
                     "Please create it from secrets.example.json and add your API key"
                 )
         
-        self.last_update = 0
+        # time.monotonic() of the last successful fetch - immune to NTP/DST clock jumps
+        self.last_update = float('-inf')
         self.cached_data = {}
+        self._display = self._build_display(_NO_STOCK_DATA)  # Display dict built from cached_data
         self.update_interval = 360  # 6 minutes during market hours
         self.startup_fetch_done = False  # Track if we've done initial fetch
+        # time.monotonic() before which get_data can skip straight to the cache
+        self._next_check_monotonic = 0.0
         
         # API configuration - only DOW and S&P
         self.api_url = "https://financialmodelingprep.com/stable/quote-short?symbol={symbol}&apikey={api_key}"
-        self.symbols = {
-            "^DJI": "DOW",
-            "^GSPC": "S&P"
+        # (API symbol, display label, cached_data key)
+        self.symbols = [
+            ("^DJI", "DOW", "dow"),
+            ("^GSPC", "S&P", "sp")
+        ]
+        # The key and symbol set are fixed, so build each quote URL once
+        self._urls = {
+            symbol: self.api_url.format(symbol=symbol, api_key=self.api_key)
+            for symbol, _, _ in self.symbols
         }
+        
+        self._load_disk_cache()
     
-    def is_market_hours(self) -> bool:
+    def _load_disk_cache(self) -> None:
+        """Restore the last fetch from disk if it is recent, skipping the startup fetch"""
+        data = load_cache(_CACHE_PATH, self.update_interval)
+        if data is None:
+            return
+        try:
+            self._display = self._build_display(data)
+        except (KeyError, TypeError):
+            return  # Written by an incompatible version
+        self.cached_data = data
+        self.last_update = time.monotonic() - (time.time() - data["timestamp"])
+        self.startup_fetch_done = True
+        print("Stock data: Restored from disk cache")
+    
+    def is_market_hours(self, now: Optional[datetime] = None) -> bool:
         """
         Check if it's currently within trading window (9:15 AM - 4:15 PM ET, weekdays)
         
+        Args:
+            now: Local time to check (defaults to datetime.now())
+        
         Returns:
             bool: True if within trading window
         """
-        import datetime
-        
         # Get current time (assuming system is in correct timezone)
-        now = datetime.datetime.now()
+        if now is None:
+            now = datetime.now()
         
         # Check if it's a weekday (Monday=0, Sunday=6)
         if now.weekday() >= 5:  # Saturday or Sunday
             return False
         
         # Check if it's within market hours (9:15 AM - 4:15 PM)
-        current_time = now.time()
-        market_open = datetime.time(9, 15)   # 9:15 AM
-        market_close = datetime.time(16, 15)  # 4:15 PM
+        return _MKT_OPEN <= now.time() <= _MKT_CLOSE
+    
+    def seconds_until_market_open(self, now: datetime) -> float:
+        """
+        Get the time remaining until the next trading window opens
         
-        return market_open <= current_time <= market_close
+        Args:
+            now: Current local time (outside market hours)
+            
+        Returns:
+            float: Seconds until the next weekday 9:15 AM
+        """
+        market_open = datetime.combine(now.date(), _MKT_OPEN)
+        if now >= market_open:
+            market_open += timedelta(days=1)
+        while market_open.weekday() >= 5:  # Skip Saturday and Sunday
+            market_open += timedelta(days=1)
+        return (market_open - now).total_seconds()
     
     def should_fetch_at_startup(self) -> bool:
         """Check if we should fetch data at startup (always yes if not done yet)"""
@@ -107,11 +158,8 @@ class StockProvider:
             Dict with quote data or empty dict if error
         """
         try:
-            url = self.api_url.format(symbol=symbol, api_key=self.api_key)
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.load(resp)
+            url = self._urls.get(symbol) or self.api_url.format(symbol=symbol, api_key=self.api_key)
+            data = get_json(url, timeout=10)
             
             return data[0] if data else {}
             
@@ -129,14 +177,19 @@ class StockProvider:
         try:
             results = {}
             
-            for symbol, label in self.symbols.items():
-                quote = self.get_quote(symbol)
+            # Request all quotes concurrently - each is an independent HTTPS round-trip
+            symbols = [symbol for symbol, _, _ in self.symbols]
+            with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+                quotes = dict(zip(symbols, executor.map(self.get_quote, symbols)))
+            
+            for symbol, label, key in self.symbols:
+                quote = quotes[symbol]
                 if quote:
                     change = quote.get("change", 0)
-                    change_int = int(round(change))
+                    change_int = round_half_away(change)
                     
                     # Format without +/- sign, just the number
-                    results[label.lower()] = {
+                    results[key] = {
                         "change": change,
                         "change_int": change_int,
                         "label": label,
@@ -145,7 +198,7 @@ class StockProvider:
                     }
                 else:
                     # Fallback data if API fails
-                    results[label.lower()] = {
+                    results[key] = {
                         "change": 0,
                         "change_int": 0,
                         "label": label,
@@ -167,7 +220,17 @@ class StockProvider:
         Returns:
             dict: Contains formatted stock strings and raw data
         """
-        current_time = time.time()
+        # Read each clock once so every decision below sees the same instant
+        now_mono = time.monotonic()
+        
+        # Nothing can change before the next check is due (next refresh during
+        # market hours, next market open otherwise) - skip the decision logic
+        if now_mono < self._next_check_monotonic and self.cached_data:
+            return self._display
+        
+        now_dt = datetime.now()
+        current_time = now_dt.timestamp()
+        in_market_hours = self.is_market_hours(now_dt)
         
         # Check if we should fetch new data
         should_fetch = False
@@ -178,7 +241,7 @@ class StockProvider:
             self.startup_fetch_done = True
             print("Stock data: Startup fetch")
         # During market hours (9:15 AM - 4:15 PM weekdays), fetch if cache is stale
-        elif self.is_market_hours() and self.is_stale():
+        elif in_market_hours and self.is_stale(now=now_mono):
             should_fetch = True
             print(f"Stock data: Market hours update (every 6 minutes)")
         # If no cached data at all, try to fetch regardless of market hours
@@ -188,55 +251,97 @@ class StockProvider:
         
         # Fetch fresh data if needed
         if should_fetch:
-            fresh_data = self.fetch_stock_data()
-            if fresh_data:
-                self.cached_data = fresh_data
-                self.last_update = current_time
-                print(f"Stock data updated successfully. Market hours: {self.is_market_hours()}")
+            if self.refresh():
+                print(f"Stock data updated successfully. Market hours: {in_market_hours}")
             elif not self.cached_data:
                 # If no cached data and API fails, return defaults
                 self.cached_data = {
                     "dow": {"change": 25, "change_int": 25, "label": "DOW", "value": "25", "symbol": "^DJI"},
-                    "s&p": {"change": 2, "change_int": 2, "label": "S&P", "value": "2", "symbol": "^GSPC"},
+                    "sp": {"change": 2, "change_int": 2, "label": "S&P", "value": "2", "symbol": "^GSPC"},
                     "timestamp": current_time
                 }
+                self._display = self._build_display(self.cached_data)
                 print("Stock data: Using default values (API failed)")
         else:
             # Update last_update even when not fetching to prevent repeated calls outside market hours
-            if not self.is_market_hours() and self.cached_data:
-                self.last_update = current_time
+            if not in_market_hours and self.cached_data:
+                self.last_update = now_mono
+        
+        if in_market_hours:
+            self._next_check_monotonic = self.last_update + self.update_interval
+        else:
+            self._next_check_monotonic = now_mono + self.seconds_until_market_open(now_dt)
+        
+        return self._display
+    
+    def _build_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the display dict for a set of cached stock data
+        
+        Only called when cached_data changes, so get_data can return the
+        same dict on every call.
         
-        # Return data formatted for display (only DOW and S&P)
+        Args:
+            data: Stock data as returned by fetch_stock_data (both symbols present)
+            
+        Returns:
+            dict: Contains formatted stock strings and raw data
+        """
+        # Only DOW and S&P
+        dow = data["dow"]
+        sp = data["sp"]
         return {
-            "dow_label": self.cached_data.get("dow", {}).get("label", "DOW"),
-            "dow_value": self.cached_data.get("dow", {}).get("value", "0"),
-            "dow_change": self.cached_data.get("dow", {}).get("change", 0),
+            "dow_label": _intern(dow["label"]),
+            "dow_value": _intern(dow["value"]),
+            "dow_change": dow["change"],
             
-            "sp_label": self.cached_data.get("s&p", {}).get("label", "S&P"),
-            "sp_value": self.cached_data.get("s&p", {}).get("value", "0"),
-            "sp_change": self.cached_data.get("s&p", {}).get("change", 0),
+            "sp_label": _intern(sp["label"]),
+            "sp_value": _intern(sp["value"]),
+            "sp_change": sp["change"],
             
-            "timestamp": self.cached_data.get("timestamp", current_time)
+            "timestamp": data["timestamp"]
         }
     
-    def is_stale(self, max_age_seconds: Optional[int] = None) -> bool:
+    def is_stale(self, max_age_seconds: Optional[int] = None, now: Optional[float] = None) -> bool:
         """
         Check if cached data is older than update interval
         
         Args:
             max_age_seconds: Override default update interval
+            now: time.monotonic() reading to compare against (defaults to a fresh read)
             
         Returns:
             bool: True if data needs refresh
         """
         max_age = max_age_seconds or self.update_interval
-        return (time.time() - self.last_update) > max_age
+        if now is None:
+            now = time.monotonic()
+        return (now - self.last_update) > max_age
+    
+    def refresh(self) -> bool:
+        """
+        Fetch fresh stock data and swap it into the cache
+        
+        The new dict is fully built before it is assigned, so a concurrent
+        reader sees either the old or the new data, never a partial update.
+        
+        Returns:
+            bool: True if the fetch succeeded and the cache was replaced
+        """
+        fresh_data = self.fetch_stock_data()
+        if not fresh_data:
+            return False
+        self.cached_data = fresh_data
+        self._display = self._build_display(fresh_data)
+        self.last_update = time.monotonic()
+        save_cache(_CACHE_PATH, fresh_data)
+        return True
     
     def update(self) -> None:
         """
         Force update of stock data
         """
-        self.fetch_stock_data()
+        self.refresh()
 
 # Global instance for easy access
 _stock_provider: Optional[StockProvider] = None
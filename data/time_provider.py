@@ -4,12 +4,41 @@ import time
 from datetime import datetime
 from typing import Dict, Any
 
+# Fixed English names - formatting directly avoids strftime's locale lookups
+_DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def _format_time(now: datetime) -> str:
+    """Format as 12-hour "H:MM" with no leading zero on the hour"""
+    return f"{now.hour % 12 or 12}:{now.minute:02d}"
+
+def _format_ampm(now: datetime) -> str:
+    """Format the AM/PM indicator"""
+    return "AM" if now.hour < 12 else "PM"
+
+def _format_date(now: datetime) -> str:
+    """Format as "Day Mon D YYYY" with no leading zero on the day"""
+    return f"{_DAY_NAMES[now.weekday()]} {_MONTH_NAMES[now.month - 1]} {now.day} {now.year}"
+
 class TimeProvider:
     """Provides current time and date information for the LED clock display"""
     
+    # Long-lived singleton with a fixed attribute set - no per-instance __dict__
+    __slots__ = ('last_update', 'cached_data', '_minute_key', '_date_key',
+                 '_time_str', '_ampm_str', '_date_str')
+    
     def __init__(self):
         self.last_update = 0
         self.cached_data = {}
+        
+        # Formatted strings only change once a minute (time/AM-PM) or once a
+        # day (date), so cache them and re-format only when the key changes
+        self._minute_key = None
+        self._date_key = None
+        self._time_str = ""
+        self._ampm_str = ""
+        self._date_str = ""
     
     def get_current_time(self) -> str:
         """
@@ -18,8 +47,7 @@ class TimeProvider:
         Returns:
             str: Time in format like "10:47"
         """
-        now = datetime.now()
-        return now.strftime("%I:%M").lstrip('0')  # Remove leading zero from hour
+        return _format_time(datetime.now())
     
     def get_current_ampm(self) -> str:
         """
@@ -28,8 +56,7 @@ class TimeProvider:
         Returns:
             str: "AM" or "PM"
         """
-        now = datetime.now()
-        return now.strftime("%p")
+        return _format_ampm(datetime.now())
     
     def get_current_date(self) -> str:
         """
@@ -38,12 +65,7 @@ class TimeProvider:
         Returns:
             str: Date in format like "Mon Sep 29 2025"
         """
-        now = datetime.now()
-        # %a = abbreviated day name (Mon, Tue, etc.)
-        # %b = abbreviated month name (Jan, Feb, etc.)
-        # %d = day of month (01-31)
-        # %Y = four-digit year
-        return now.strftime("%a %b %d %Y").replace(' 0', ' ')  # Remove leading zero from day
+        return _format_date(datetime.now())
     
     def get_data(self) -> Dict[str, Any]:
         """
@@ -54,11 +76,25 @@ class TimeProvider:
         """
         current_time = time.time()
         
+        # Read the clock once per call
+        now = datetime.now()
+        
+        minute_key = (now.hour, now.minute)
+        if minute_key != self._minute_key:
+            self._time_str = _format_time(now)
+            self._ampm_str = _format_ampm(now)
+            self._minute_key = minute_key
+        
+        date_key = now.toordinal()
+        if date_key != self._date_key:
+            self._date_str = _format_date(now)
+            self._date_key = date_key
+        
         # Always return fresh data for time (it changes every second)
         data = {
-            'time': self.get_current_time(),
-            'ampm': self.get_current_ampm(),
-            'date': self.get_current_date(),
+            'time': self._time_str,
+            'ampm': self._ampm_str,
+            'date': self._date_str,
             'timestamp': current_time
         }
         
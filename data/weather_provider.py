@@ -1,33 +1,63 @@
 # data/weather_provider.py - Provides weather information from Open-Meteo API
 
-import json
-import urllib.request
 import time
-import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from datetime import datetime
 
-def load_secrets() -> Dict[str, Any]:
-    """
-    Load secrets from secrets.json file
-    
-    Returns:
-        Dictionary of secrets
-        
-    Raises:
-        FileNotFoundError: If secrets.json doesn't exist
-        json.JSONDecodeError: If secrets.json is invalid
-    """
-    # Get the path to secrets.json (in project root, one level up from data/)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    secrets_path = os.path.join(current_dir, '..', 'secrets.json')
-    
-    with open(secrets_path, 'r') as f:
-        return json.load(f)
+from .http_client import get_json
+from .secrets_loader import load_secrets
+from .disk_cache import cache_path, load_cache, save_cache
+from utils.rounding import round_half_away
+
+# Weather settings from config.py, imported once (config has no imports of its
+# own, so there is no cycle); None when the provider runs without the app config
+try:
+    from config import Weather as WeatherConfig
+except ImportError:
+    WeatherConfig = None
+
+# Last successful fetch, reused on restart while still fresh
+_CACHE_PATH = cache_path("weather.json")
+
+def _build_code_table() -> tuple:
+    """Build the WMO code (0-99) -> display category lookup table"""
+    table = ['cloudy'] * 100  # default for unlisted codes
+    groups = {
+        'clear': (0,),
+        'partly_cloudy': (1, 2),
+        'cloudy': (3,),
+        'fog': (45, 48),
+        'rain': (51, 53, 55, 61, 80, 81),
+        'heavy_rain': (63, 65, 82),
+        'freezing_rain': (56, 57, 66, 67),
+        'snow': (71, 73, 75, 77, 85, 86),
+        'thunderstorm': (95, 96, 99),
+    }
+    for category, codes in groups.items():
+        for code in codes:
+            table[code] = category
+    return tuple(table)
+
+_CODE_TO_CATEGORY = _build_code_table()
+
+# Fallback values used when there is no cached data and the API fails
+_DEFAULT_DATA = MappingProxyType({
+    "current": 70,
+    "high": 75,
+    "low": 65,
+    "condition": "cloudy",
+    "current_code": 3,
+    "hourly_codes": (3,) * 8,
+})
 
 class WeatherProvider:
     """Provides current weather information for the LED clock display"""
     
+    # Long-lived singleton with a fixed attribute set - no per-instance __dict__
+    __slots__ = ('latitude', 'longitude', 'last_update', 'cached_data', '_display',
+                 'update_interval', 'api_url', '_night_cache')
+    
     def __init__(self, latitude: Optional[float] = None, longitude: Optional[float] = None):
         """
         Initialize weather provider
@@ -61,14 +91,28 @@ class WeatherProvider:
                     "Please create it from secrets.example.json and add your location"
                 )
         
-        self.last_update = 0
+        # Validate once here rather than failing on every fetch with a bad URL
+        try:
+            self.latitude = float(self.latitude)
+            self.longitude = float(self.longitude)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Invalid location: LATITUDE={self.latitude!r}, LONGITUDE={self.longitude!r} "
+                "(both must be numbers)"
+            )
+        
+        # time.monotonic() of the last successful fetch - immune to NTP/DST clock jumps
+        self.last_update = float('-inf')
         self.cached_data = {}
+        self._display: Mapping[str, Any] = MappingProxyType({})  # Read-only view built from cached_data
         self.update_interval = 900  # 15 minutes
+        # (hour, result) of the last simple-method is_nighttime() check
+        self._night_cache = (-1, False)
         
         # Build API URL - now includes hourly weather codes and sunrise/sunset
         self.api_url = (
             f"https://api.open-meteo.com/v1/forecast"
-            f"?latitude={self.latitude}&longitude={self.longitude}"
+            f"?latitude={self.latitude:.5f}&longitude={self.longitude:.5f}"
             f"&current_weather=true"
             f"&daily=temperature_2m_max,temperature_2m_min,sunrise,sunset"
             f"&hourly=weather_code"
@@ -76,6 +120,24 @@ class WeatherProvider:
             f"&temperature_unit=fahrenheit"
             f"&forecast_hours=8"
         )
+        
+        self._load_disk_cache()
+    
+    def _load_disk_cache(self) -> None:
+        """Restore the last fetch from disk if it is recent"""
+        data = load_cache(_CACHE_PATH, self.update_interval)
+        if data is None:
+            return
+        try:
+            # Sunrise/sunset are stored as ISO strings
+            data["sunrise"] = datetime.fromisoformat(data["sunrise"])
+            data["sunset"] = datetime.fromisoformat(data["sunset"])
+            self._display = self._build_display(data)
+        except (KeyError, TypeError, ValueError):
+            return  # Written by an incompatible version
+        self.cached_data = data
+        self.last_update = time.monotonic() - (time.time() - data["timestamp"])
+        print("Weather data: Restored from disk cache")
     
     def _classify_weather_code(self, code: int) -> str:
         """
@@ -88,26 +150,9 @@ class WeatherProvider:
             Category string: 'clear', 'partly_cloudy', 'cloudy', 'rain', 
                            'thunderstorm', 'snow', 'fog', 'freezing_rain', 'heavy_rain'
         """
-        if code == 0:
-            return 'clear'
-        elif code in [1, 2]:
-            return 'partly_cloudy'
-        elif code == 3:
-            return 'cloudy'
-        elif code in [45, 48]:
-            return 'fog'
-        elif code in [51, 53, 55, 61, 80, 81]:
-            return 'rain'
-        elif code in [63, 65, 82]:
-            return 'heavy_rain'
-        elif code in [56, 57, 66, 67]:
-            return 'freezing_rain'
-        elif code in [71, 73, 75, 77, 85, 86]:
-            return 'snow'
-        elif code in [95, 96, 99]:
-            return 'thunderstorm'
-        else:
-            return 'cloudy'  # default fallback
+        if 0 <= code < 100:
+            return _CODE_TO_CATEGORY[code]
+        return 'cloudy'  # default fallback
     
     def get_weighted_forecast_condition(self, current_code: int, hourly_codes: list) -> str:
         """
@@ -123,12 +168,10 @@ class WeatherProvider:
         Returns:
             Condition string for icon display (e.g., 'rain', 'clear', 'cloudy')
         """
-        # Import config here to avoid circular imports
-        try:
-            from config import Weather as WeatherConfig
+        if WeatherConfig is not None:
             weights = WeatherConfig.FORECAST_WEIGHTS
             current_weight = WeatherConfig.CURRENT_WEIGHT
-        except ImportError:
+        else:
             # Fallback to default weights if config not available
             weights = [2, 2, 4, 4, 1, 1, 1, 1]
             current_weight = 3
@@ -141,17 +184,14 @@ class WeatherProvider:
         category_scores[current_category] = current_weight
         
         # Add forecasted hours with their respective weights
-        for i, code in enumerate(hourly_codes[:8]):  # Only use first 8 hours
-            if i >= len(weights):
-                break
-            
+        # zip stops at whichever runs out first: the 8 hours or the configured weights
+        for code, weight in zip(hourly_codes[:8], weights):  # Only use first 8 hours
             category = self._classify_weather_code(code)
-            weight = weights[i]
             category_scores[category] = category_scores.get(category, 0) + weight
         
-        # Return category with highest weighted score
+        # Return category with highest weighted score (ties go to the first category seen)
         if category_scores:
-            return max(category_scores, key=lambda k: category_scores[k])
+            return max(category_scores, key=category_scores.__getitem__)
         else:
             return 'cloudy'  # fallback
     
@@ -165,13 +205,13 @@ class WeatherProvider:
         Returns:
             True if nighttime, False if daytime
         """
+        now = datetime.now()
         try:
-            from config import Weather as WeatherConfig
+            # AttributeError (handled below) also covers a missing config module
             method = WeatherConfig.DAY_NIGHT_METHOD
             
             if method == 'api' and 'sunrise' in self.cached_data and 'sunset' in self.cached_data:
                 # Use actual sunrise/sunset times from API
-                now = datetime.now()
                 sunrise = self.cached_data['sunrise']
                 sunset = self.cached_data['sunset']
                 
@@ -187,21 +227,26 @@ class WeatherProvider:
                 # Night if before sunrise or after sunset
                 return now < sunrise or now > sunset
             
-            # Fall back to simple method
-            now = datetime.now()
+            # Fall back to simple method - the answer only changes on the hour
             hour = now.hour
+            cached_hour, cached_result = self._night_cache
+            if hour == cached_hour:
+                return cached_result
+            
             night_start = WeatherConfig.SIMPLE_NIGHT_START
             night_end = WeatherConfig.SIMPLE_NIGHT_END
             
             # Handle wraparound (e.g., 20:00 to 6:00)
             if night_start > night_end:
-                return hour >= night_start or hour < night_end
+                result = hour >= night_start or hour < night_end
             else:
-                return night_start <= hour < night_end
+                result = night_start <= hour < night_end
+            self._night_cache = (hour, result)
+            return result
                 
-        except (ImportError, AttributeError, KeyError):
+        except (AttributeError, KeyError):
             # Fallback: simple 8pm-6am check
-            hour = datetime.now().hour
+            hour = now.hour
             return hour >= 20 or hour < 6
     
     def fetch_weather_data(self) -> Optional[Dict[str, Any]]:
@@ -212,13 +257,12 @@ class WeatherProvider:
             Dict with weather data including temps and forecast condition, or None if error
         """
         try:
-            with urllib.request.urlopen(self.api_url, timeout=10) as response:
-                data = json.load(response)
+            data = get_json(self.api_url, timeout=10)
             
             # Extract temperature data
-            current_temp = int(round(data["current_weather"]["temperature"]))
-            high_temp = int(round(data["daily"]["temperature_2m_max"][0]))
-            low_temp = int(round(data["daily"]["temperature_2m_min"][0]))
+            current_temp = round_half_away(data["current_weather"]["temperature"])
+            high_temp = round_half_away(data["daily"]["temperature_2m_max"][0])
+            low_temp = round_half_away(data["daily"]["temperature_2m_min"][0])
             
             # Extract sunrise and sunset times (ISO format strings)
             sunrise_str = data["daily"]["sunrise"][0]  # e.g., "2025-10-09T07:15"
@@ -266,22 +310,18 @@ class WeatherProvider:
             print(f"Error fetching weather data: {e}")
             return None
     
-    def get_data(self) -> Dict[str, Any]:
+    def get_data(self) -> Mapping[str, Any]:
         """
         Get weather data for display
         
         Returns:
-            dict: Contains formatted weather strings, icon condition, and raw data
+            Read-only mapping with formatted weather strings, icon condition, and raw data
         """
         current_time = time.time()
         
         # Update if cache is stale or empty
         if self.is_stale() or not self.cached_data:
-            fresh_data = self.fetch_weather_data()
-            if fresh_data:
-                self.cached_data = fresh_data
-                self.last_update = current_time
-            elif not self.cached_data:
+            if not self.refresh() and not self.cached_data:
                 # If no cached data and API fails, return default
                 # Use current time +/- some hours for default sunrise/sunset
                 now = datetime.now()
@@ -289,43 +329,54 @@ class WeatherProvider:
                 default_sunset = now.replace(hour=19, minute=0, second=0, microsecond=0)
                 
                 self.cached_data = {
-                    "current": 70,
-                    "high": 75,
-                    "low": 65,
-                    "condition": "cloudy",
+                    **_DEFAULT_DATA,
                     "is_night": self.is_nighttime(),
-                    "current_code": 3,
-                    "hourly_codes": [3] * 8,
                     "sunrise": default_sunrise,
                     "sunset": default_sunset,
                     "timestamp": current_time
                 }
+                self._display = self._build_display(self.cached_data)
         
-        # Format for display
-        return {
+        return self._display
+    
+    def _build_display(self, data: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Build the display mapping for a set of cached weather data
+        
+        Only called when cached_data changes, so get_data can return the
+        same mapping on every call without reformatting. It is read-only
+        because every caller shares it.
+        
+        Args:
+            data: Weather data as returned by fetch_weather_data
+            
+        Returns:
+            Read-only mapping with formatted weather strings, icon condition, and raw data
+        """
+        return MappingProxyType({
             # Temperature strings
-            "high_low_text": f"H{self.cached_data['high']} L{self.cached_data['low']}",
-            "current_text": f"Now {self.cached_data['current']}",
+            "high_low_text": f"H{data['high']} L{data['low']}",
+            "current_text": f"Now {data['current']}",
             
             # Raw temperature values
-            "current": self.cached_data["current"],
-            "high": self.cached_data["high"],
-            "low": self.cached_data["low"],
+            "current": data["current"],
+            "high": data["high"],
+            "low": data["low"],
             
             # Icon information
-            "condition": self.cached_data["condition"],
-            "is_night": self.cached_data["is_night"],
+            "condition": data["condition"],
+            "is_night": data["is_night"],
             
             # Sunrise/sunset times (datetime objects)
-            "sunrise": self.cached_data.get("sunrise"),
-            "sunset": self.cached_data.get("sunset"),
+            "sunrise": data["sunrise"],
+            "sunset": data["sunset"],
             
             # Debug/raw data
-            "current_code": self.cached_data.get("current_code", 0),
-            "hourly_codes": self.cached_data.get("hourly_codes", []),
+            "current_code": data["current_code"],
+            "hourly_codes": data["hourly_codes"],
             
-            "timestamp": self.cached_data["timestamp"]
-        }
+            "timestamp": data["timestamp"]
+        })
     
     def is_stale(self, max_age_seconds: Optional[int] = None) -> bool:
         """
@@ -338,13 +389,32 @@ class WeatherProvider:
             bool: True if data needs refresh
         """
         max_age = max_age_seconds or self.update_interval
-        return (time.time() - self.last_update) > max_age
+        return (time.monotonic() - self.last_update) > max_age
+    
+    def refresh(self) -> bool:
+        """
+        Fetch fresh weather data and swap it into the cache
+        
+        The new dict is fully built before it is assigned, so a concurrent
+        reader sees either the old or the new data, never a partial update.
+        
+        Returns:
+            bool: True if the fetch succeeded and the cache was replaced
+        """
+        fresh_data = self.fetch_weather_data()
+        if not fresh_data:
+            return False
+        self.cached_data = fresh_data
+        self._display = self._build_display(fresh_data)
+        self.last_update = time.monotonic()
+        save_cache(_CACHE_PATH, fresh_data)
+        return True
     
     def update(self) -> None:
         """
         Force update of weather data
         """
-        self.fetch_weather_data()
+        self.refresh()
 
 # Global instance for easy access
 _weather_provider: Optional[WeatherProvider] = None
@@ -1,11 +1,19 @@
 # display/headline_scroller.py - Optimized strip-based scrolling with block tracking
 
-from typing import List, Optional, Dict, Any, Tuple
+import hashlib
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from PIL import Image
-from config import Layout, Colors
+from config import Colors, HEADLINES_HEIGHT
 from fonts.font_manager import get_font_manager
 from fonts.bitmap_font import BitmapFontAdapter
 
+# Rendered headline masks to keep (feeds repeat stories across refreshes)
+_MASK_CACHE_SIZE = 256
+
 class OptimizedHeadlineScroller:
     """Strip-based headline scroller with block-based memory management"""
     
@@ -20,16 +28,38 @@ class OptimizedHeadlineScroller:
         self.scroll_speed = 1  # Pixels per frame
         
         # Strip-based scrolling
+        # The strip holds only text coverage ('L' mode, 255 = text, 0 = background);
+        # color is applied when the viewport is drawn, keeping it at 1 byte/pixel
         self.headline_strip: Optional[Image.Image] = None
         self.strip_width = 0
+        # Column of headline_strip where strip position 0 lives. Trimming only
+        # moves this forward instead of copying the strip. The strip_width
+        # columns from here are followed by a copy of the first display_width
+        # columns, so the viewport is always one contiguous slice (no wrap case)
+        self._strip_origin = 0
         self.scroll_x = 0  # Current X offset into the strip
+        self._trim_counter = 0  # Pixels scrolled since the last trim check
         
         # Headline management
         self.current_headlines: List[str] = []
-        self.last_headlines_hash: Optional[str] = None
+        self.last_headlines_hash: Optional[bytes] = None
         
         # NEW: Block tracking for memory management
-        self.blocks: List[Dict[str, Any]] = []  # List of {start_pixel, end_pixel, headline_count}
+        # One entry per block in each parallel list: strip position where the
+        # block starts, where it ends (ascending), and how many headlines it holds
+        self.block_starts: List[int] = []
+        self.block_ends: List[int] = []
+        self.block_counts: List[int] = []
+        
+        # LRU of headline text (with separator) -> rendered paste mask
+        self._mask_cache: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._mask_lock = threading.Lock()
+        
+        # New headlines are rasterised on a worker thread while the current
+        # strip keeps scrolling; the result is appended once it is ready
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="headline-render")
+        self._pending_masks: Optional[Future] = None
+        self._pending_hash: Optional[bytes] = None
         
         # Font setup
         font_manager = get_font_manager()
@@ -52,9 +82,66 @@ class OptimizedHeadlineScroller:
         ]
         self._build_headline_strip(default_headlines)
         
-    def _calculate_headlines_hash(self, headlines: List[str]) -> str:
-        """Calculate a hash of headlines to detect changes"""
-        return str(hash(tuple(headlines)))
+    def _calculate_headlines_hash(self, headlines: List[str]) -> bytes:
+        """Calculate a hash of headlines to detect changes (stable across restarts)"""
+        return hashlib.blake2b(
+            b'\0'.join(headline.encode('utf-8') for headline in headlines), digest_size=8
+        ).digest()
+    
+    def _get_headline_mask(self, headline_text: str) -> Optional[Image.Image]:
+        """
+        Get the paste mask for a headline, rendering it only on a cache miss
+        
+        Args:
+            headline_text: Headline text, including any leading separator
+            
+        Returns:
+            'L' image that is 255 on text pixels and 0 elsewhere, or None if
+            the text could not be rendered
+        """
+        with self._mask_lock:
+            mask = self._mask_cache.get(headline_text)
+            if mask is not None:
+                self._mask_cache.move_to_end(headline_text)
+                return mask
+        
+        # The font's text mask is already 255 on text pixels, 0 elsewhere
+        mask = self.font_adapter.font_manager.create_text_mask(
+            headline_text, self.font_adapter.font_type
+        )
+        if not mask:
+            return None
+        
+        with self._mask_lock:
+            self._mask_cache[headline_text] = mask
+            if len(self._mask_cache) > _MASK_CACHE_SIZE:
+                self._mask_cache.popitem(last=False)
+        return mask
+    
+    def _paste_headline(self, strip: Image.Image, mask: Image.Image, x: int) -> None:
+        """
+        Draw a headline into the strip, vertically centered
+        
+        The text mask is filled in a single C-level paste instead of a
+        per-pixel loop. Anything outside the strip is clipped by PIL.
+        
+        Args:
+            strip: Strip mask to draw into
+            mask: Headline mask from _get_headline_mask
+            x: Left edge of the headline within the strip
+        """
+        y_offset = max(0, (HEADLINES_HEIGHT - mask.height) // 2)
+        strip.paste(255, (x, y_offset), mask)
+    
+    def _write_wrap_tail(self) -> None:
+        """Repeat the first display_width strip columns just past the strip end"""
+        strip = self.headline_strip
+        origin = self._strip_origin
+        end = origin + self.strip_width
+        wrap_width = min(self.strip_width, self.display_width)
+        
+        strip.paste(0, (end, 0, end + self.display_width, HEADLINES_HEIGHT))
+        strip.paste(strip.crop((origin, 0, origin + wrap_width, HEADLINES_HEIGHT)), (end, 0))
     
     def _build_headline_strip(self, headlines: List[str]) -> None:
         """
@@ -65,15 +152,17 @@ class OptimizedHeadlineScroller:
         """
         if not headlines:
             # Create minimal empty strip
-            self.headline_strip = Image.new('RGB', (self.display_width, Layout.HEADLINES_HEIGHT), (0, 0, 0))
+            self.headline_strip = Image.new('L', (self.display_width * 2, HEADLINES_HEIGHT), 0)
             self.strip_width = self.display_width
-            self.blocks = []
+            self._strip_origin = 0
+            self._clear_blocks()
+            self._write_wrap_tail()
             return
         
         # Calculate total width needed
         separator = " • "  # Bullet separator between headlines
         total_width = 0
-        headline_images = []
+        headline_masks = []
         
         for i, headline in enumerate(headlines):
             # Add separator except for first headline
@@ -82,14 +171,12 @@ class OptimizedHeadlineScroller:
             else:
                 headline_text = headline
             
-            # Create PIL image for this headline
-            headline_image = self.font_adapter.font_manager.create_text_image(
-                headline_text, self.font_adapter.font_type
-            )
+            # Get the rendered mask for this headline
+            headline_mask = self._get_headline_mask(headline_text)
             
-            if headline_image:
-                headline_images.append(headline_image)
-                total_width += headline_image.width
+            if headline_mask:
+                headline_masks.append(headline_mask)
+                total_width += headline_mask.width
             else:
                 # Fallback for failed headline creation
                 fallback_width, _ = self.font_adapter.getsize(headline_text)
@@ -99,43 +186,25 @@ class OptimizedHeadlineScroller:
         buffer_width = self.display_width * 2
         total_width += buffer_width
         
-        # Create the strip image
-        self.headline_strip = Image.new('RGB', (total_width, Layout.HEADLINES_HEIGHT), (0, 0, 0))
+        # Create the strip image (with room for the wrap-around columns)
+        self.headline_strip = Image.new('L', (total_width + self.display_width, HEADLINES_HEIGHT), 0)
+        self._strip_origin = 0
         
         # Paste all headline images into the strip
         current_x = 0
-        for headline_image in headline_images:
-            if headline_image:
-                # Calculate vertical centering
-                y_offset = (Layout.HEADLINES_HEIGHT - headline_image.height) // 2
-                y_offset = max(0, y_offset)  # Ensure non-negative
-                
-                # Paste with color (yellow text)
-                for y in range(headline_image.height):
-                    for x in range(headline_image.width):
-                        if y_offset + y >= Layout.HEADLINES_HEIGHT:
-                            break
-                        if current_x + x >= total_width:
-                            break
-                            
-                        pixel = headline_image.getpixel((x, y))
-                        if pixel != (0, 0, 0):  # Non-black pixel (text)
-                            self.headline_strip.putpixel(
-                                (current_x + x, y_offset + y), 
-                                Colors.YELLOW
-                            )
-                
-                current_x += headline_image.width
+        for headline_mask in headline_masks:
+            if headline_mask:
+                self._paste_headline(self.headline_strip, headline_mask, current_x)
+                current_x += headline_mask.width
         
         self.strip_width = total_width
-        self.current_headlines = headlines.copy()
+        self.current_headlines = list(headlines)
+        self._write_wrap_tail()
         
         # NEW: Initialize blocks list with first block
-        self.blocks = [{
-            'start_pixel': 0,
-            'end_pixel': total_width,
-            'headline_count': len(headlines)
-        }]
+        self.block_starts = [0]
+        self.block_ends = [total_width]
+        self.block_counts = [len(headlines)]
         
         print(f"Built headline strip: {len(headlines)} headlines, {total_width} pixels wide (Block 0)")
     
@@ -148,7 +217,14 @@ class OptimizedHeadlineScroller:
         if headlines_hash == self.last_headlines_hash:
             return
 
-        self.blocks = []
+        # Drop any background render started for the old strip, so it can't
+        # be appended to the new one by a later update_headlines call
+        if self._pending_masks is not None:
+            self._pending_masks.cancel()
+        self._pending_masks = None
+        self._pending_hash = None
+
+        self._clear_blocks()
         self.scroll_x = 0
         self._build_headline_strip(headlines)
         self.last_headlines_hash = headlines_hash
@@ -168,18 +244,62 @@ class OptimizedHeadlineScroller:
         if headlines_hash == self.last_headlines_hash:
             return  # No change needed
         
+        if headlines_hash != self._pending_hash:
+            # Rasterise the new headlines off the display thread; keep
+            # scrolling the current strip until they are ready
+            self._pending_hash = headlines_hash
+            self._pending_masks = self._render_executor.submit(self._render_append_masks, list(headlines))
+            return
+        
+        if self._pending_masks is None or not self._pending_masks.done():
+            return  # Still rendering
+        
+        try:
+            new_headline_masks = self._pending_masks.result()
+        except Exception as e:
+            print(f"Error rendering headlines: {e}")
+            new_headline_masks = None
+        self._pending_masks = None
+        self._pending_hash = None
+        
         # Append new headlines to existing strip for seamless transition
-        self._append_headlines_to_strip(headlines)
+        self._append_headlines_to_strip(headlines, new_headline_masks)
         self.last_headlines_hash = headlines_hash
         
-        print(f"Updated headlines: {len(headlines)} new headlines appended as Block {len(self.blocks) - 1}")
+        print(f"Updated headlines: {len(headlines)} new headlines appended as Block {len(self.block_ends) - 1}")
+    
+    def _render_append_masks(self, new_headlines: List[str]) -> List[Image.Image]:
+        """
+        Render the masks for headlines to be appended (runs on the worker thread)
+        
+        Args:
+            new_headlines: List of new headline strings to append
+            
+        Returns:
+            Masks for the headlines that rendered, in order
+        """
+        separator = " • "
+        new_headline_masks = []
+        
+        for headline in new_headlines:
+            headline_text = separator + headline  # Always add separator for appended headlines
+            
+            headline_mask = self._get_headline_mask(headline_text)
+            
+            if headline_mask:
+                new_headline_masks.append(headline_mask)
+        
+        return new_headline_masks
     
-    def _append_headlines_to_strip(self, new_headlines: List[str]) -> None:
+    def _append_headlines_to_strip(self, new_headlines: List[str],
+                                   new_headline_masks: Optional[List[Image.Image]] = None) -> None:
         """
         Append new headlines to the existing strip for seamless scrolling
         
         Args:
             new_headlines: List of new headline strings to append
+            new_headline_masks: Masks from _render_append_masks, if already
+                rendered (rendered here otherwise)
         """
         if not new_headlines or not self.headline_strip:
             # Fall back to rebuilding the entire strip
@@ -187,69 +307,56 @@ class OptimizedHeadlineScroller:
             return
         
         # Calculate width needed for new headlines
-        separator = " • "
-        new_width = 0
-        new_headline_images = []
+        if new_headline_masks is None:
+            new_headline_masks = self._render_append_masks(new_headlines)
+        new_width = sum(headline_mask.width for headline_mask in new_headline_masks)
         
-        for headline in new_headlines:
-            headline_text = separator + headline  # Always add separator for appended headlines
-            
-            headline_image = self.font_adapter.font_manager.create_text_image(
-                headline_text, self.font_adapter.font_type
-            )
-            
-            if headline_image:
-                new_headline_images.append(headline_image)
-                new_width += headline_image.width
-        
-        if not new_headline_images:
+        if not new_headline_masks:
             return  # Nothing to append
         
+        # Drop blocks that have already scrolled past before extending the strip,
+        # so the extended strip only carries content that can still be shown
+        self.trim_scrolled_blocks()
+        
         # NEW: Record where this block starts
         block_start = self.strip_width
-        
-        # Create extended strip
         extended_width = self.strip_width + new_width
-        extended_strip = Image.new('RGB', (extended_width, Layout.HEADLINES_HEIGHT), (0, 0, 0))
         
-        # Copy existing strip
-        if self.headline_strip:
-            extended_strip.paste(self.headline_strip, (0, 0))
+        if self._strip_origin + extended_width + self.display_width > self.headline_strip.width:
+            # Out of headroom: move the live part of the strip into a new image
+            # with twice the room it needs, so later appends can write in place
+            capacity = 2 * extended_width + self.display_width
+            extended_strip = Image.new('L', (capacity, HEADLINES_HEIGHT), 0)
+            extended_strip.paste(self.headline_strip, (-self._strip_origin, 0))
+            self.headline_strip = extended_strip
+            self._strip_origin = 0
+        
+        # Clear the old wrap-around columns (everything past them is still blank)
+        append_x = self._strip_origin + self.strip_width
+        self.headline_strip.paste(0, (append_x, 0, append_x + self.display_width, HEADLINES_HEIGHT))
         
         # Append new headlines
-        current_x = self.strip_width
-        for headline_image in new_headline_images:
-            if headline_image:
-                y_offset = (Layout.HEADLINES_HEIGHT - headline_image.height) // 2
-                y_offset = max(0, y_offset)
-                
-                for y in range(headline_image.height):
-                    for x in range(headline_image.width):
-                        if y_offset + y >= Layout.HEADLINES_HEIGHT:
-                            break
-                        if current_x + x >= extended_width:
-                            break
-                            
-                        pixel = headline_image.getpixel((x, y))
-                        if pixel != (0, 0, 0):
-                            extended_strip.putpixel(
-                                (current_x + x, y_offset + y), 
-                                Colors.YELLOW
-                            )
-                
-                current_x += headline_image.width
+        current_x = append_x
+        for headline_mask in new_headline_masks:
+            if headline_mask:
+                self._paste_headline(self.headline_strip, headline_mask, current_x)
+                current_x += headline_mask.width
         
         # Update strip
-        self.headline_strip = extended_strip
         self.strip_width = extended_width
+        self._write_wrap_tail()
         self.current_headlines.extend(new_headlines)
         
         # NEW: Record this as a new block
-        self.blocks.append({
-            'start_pixel': block_start,
-            'end_pixel': extended_width,
-            'headline_count': len(new_headlines)
-        })
+        self.block_starts.append(block_start)
+        self.block_ends.append(extended_width)
+        self.block_counts.append(len(new_headlines))
+    
+    def _clear_blocks(self) -> None:
+        """Forget all block tracking"""
+        self.block_starts = []
+        self.block_ends = []
+        self.block_counts = []
     
     def trim_scrolled_blocks(self) -> None:
         """
@@ -257,45 +364,40 @@ class OptimizedHeadlineScroller:
         Only removes entire blocks, never partial blocks.
         Always keeps at least one block (the current one).
         """
-        if not self.blocks or len(self.blocks) <= 1:
+        block_ends = self.block_ends
+        if len(block_ends) <= 1:
             return  # Keep at least one block
         
-        # Find blocks that are completely behind scroll_x
-        blocks_to_trim = []
-        for block in self.blocks[:-1]:  # Never consider the last block for trimming
-            if self.scroll_x > block['end_pixel']:
-                blocks_to_trim.append(block)
-            else:
-                break  # Stop at first block we haven't fully scrolled past
+        if self.scroll_x <= block_ends[0]:
+            return  # Still inside the first block (the usual case)
+        
+        # Count blocks that are completely behind scroll_x (ends are ascending);
+        # never consider the last block for trimming
+        trim_count = min(bisect_left(block_ends, self.scroll_x), len(block_ends) - 1)
         
-        if not blocks_to_trim:
+        if not trim_count:
             return  # Nothing to trim
         
         # Calculate how much to trim (up to the end of the last fully-scrolled block)
-        trim_amount = blocks_to_trim[-1]['end_pixel']
+        trim_amount = block_ends[trim_count - 1]
         
-        # Crop the strip
+        # Move the strip start past the trimmed blocks; the pixels are left in
+        # place (no copy) and reclaimed when an append next reallocates the strip
         if self.headline_strip is not None:
-            new_strip = self.headline_strip.crop((
-                trim_amount, 0,
-                self.strip_width, Layout.HEADLINES_HEIGHT
-            ))
-            
-            # Update tracking
-            self.headline_strip = new_strip
-            self.strip_width = new_strip.width
+            self._strip_origin += trim_amount
+            self.strip_width -= trim_amount
+            self._write_wrap_tail()
             self.scroll_x -= trim_amount
         else:
             return
         
         # Remove trimmed blocks and adjust remaining block positions
-        self.blocks = self.blocks[len(blocks_to_trim):]
-        for block in self.blocks:
-            block['start_pixel'] -= trim_amount
-            block['end_pixel'] -= trim_amount
+        total_headlines_trimmed = sum(self.block_counts[:trim_count])
+        self.block_starts = [start - trim_amount for start in self.block_starts[trim_count:]]
+        self.block_ends = [end - trim_amount for end in block_ends[trim_count:]]
+        self.block_counts = self.block_counts[trim_count:]
         
-        total_headlines_trimmed = sum(b['headline_count'] for b in blocks_to_trim)
-        print(f"Trimmed {len(blocks_to_trim)} block(s): {total_headlines_trimmed} headlines, {trim_amount} pixels removed")
+        print(f"Trimmed {trim_count} block(s): {total_headlines_trimmed} headlines, {trim_amount} pixels removed")
     
     def get_display_slice(self) -> Image.Image:
         """
@@ -304,42 +406,51 @@ class OptimizedHeadlineScroller:
         Returns:
             PIL Image of the current viewport
         """
-        if not self.headline_strip:
-            return Image.new('RGB', (self.display_width, Layout.HEADLINES_HEIGHT), (0, 0, 0))
+        # The only allocation is the returned image; no cropped mask is made
+        slice_image = Image.new('RGB', (self.display_width, HEADLINES_HEIGHT), (0, 0, 0))
+        self.paste_display_slice(slice_image, 0)
+        return slice_image
+    
+    def get_viewport_key(self) -> bytes:
+        """
+        Get the text mask of the current viewport as bytes
+        
+        Returns:
+            Bytes that are equal whenever two viewports would look the same
+        """
+        if self.headline_strip is None:
+            return b''
         
         # Ensure scroll position is valid
         if self.scroll_x >= self.strip_width:
             self.scroll_x = 0  # Loop back to beginning
         
-        # Extract slice from strip
-        end_x = self.scroll_x + self.display_width
+        x = self._strip_origin + self.scroll_x
+        return self.headline_strip.crop((x, 0, x + self.display_width, HEADLINES_HEIGHT)).tobytes()
+    
+    def paste_display_slice(self, target: Image.Image, y: int) -> None:
+        """
+        Paste the current 64-pixel wide view from the strip straight into a frame
         
-        if end_x <= self.strip_width:
-            # Simple case: slice fits entirely within strip
-            return self.headline_strip.crop((self.scroll_x, 0, end_x, Layout.HEADLINES_HEIGHT))
-        else:
-            # Wrap-around case: need to combine end of strip with beginning
-            slice_image = Image.new('RGB', (self.display_width, Layout.HEADLINES_HEIGHT), (0, 0, 0))
-            
-            # Copy remaining portion from current position
-            remaining_width = self.strip_width - self.scroll_x
-            if remaining_width > 0:
-                end_slice = self.headline_strip.crop((
-                    self.scroll_x, 0, 
-                    self.strip_width, Layout.HEADLINES_HEIGHT
-                ))
-                slice_image.paste(end_slice, (0, 0))
-            
-            # Copy beginning portion to fill the rest
-            wrap_width = self.display_width - remaining_width
-            if wrap_width > 0:
-                start_slice = self.headline_strip.crop((
-                    0, 0, 
-                    min(wrap_width, self.strip_width), Layout.HEADLINES_HEIGHT
-                ))
-                slice_image.paste(start_slice, (remaining_width, 0))
-            
-            return slice_image
+        Same pixels as get_display_slice(), but the strip is pasted at a negative
+        offset and PIL clips it to the frame, so no intermediate slice image
+        is allocated.
+        
+        Args:
+            target: Frame image to draw into (the viewport spans x=0..display_width-1)
+            y: Top row of the headline area in the target
+        """
+        if self.headline_strip is None:
+            target.paste((0, 0, 0), (0, y, self.display_width, y + HEADLINES_HEIGHT))
+            return
+        
+        # Ensure scroll position is valid
+        if self.scroll_x >= self.strip_width:
+            self.scroll_x = 0  # Loop back to beginning
+        
+        # Clear the viewport, then fill the text pixels in yellow
+        target.paste((0, 0, 0), (0, y, self.display_width, y + HEADLINES_HEIGHT))
+        target.paste(Colors.YELLOW, (-(self._strip_origin + self.scroll_x), y), self.headline_strip)
     
     def advance_scroll(self, pixels: Optional[int] = None) -> None:
         """
@@ -352,15 +463,13 @@ class OptimizedHeadlineScroller:
             return
             
         pixels = pixels or self.scroll_speed
-        self.scroll_x += pixels
-        
-        # Handle wrap-around
-        if self.scroll_x >= self.strip_width:
-            self.scroll_x = self.scroll_x % self.strip_width
+        self.scroll_x = (self.scroll_x + pixels) % self.strip_width
         
         # NEW: Trim old blocks periodically (check every ~1000 pixels scrolled)
         # This runs about once per complete cycle through a block of headlines
-        if self.scroll_x % 1000 < self.scroll_speed:
+        self._trim_counter += pixels
+        if self._trim_counter >= 1000:
+            self._trim_counter = 0
             self.trim_scrolled_blocks()
     
     def set_scroll_speed(self, speed: int) -> None:
@@ -380,7 +489,7 @@ class OptimizedHeadlineScroller:
             Info string about current state
         """
         headline_count = len(self.current_headlines)
-        block_count = len(self.blocks)
+        block_count = len(self.block_ends)
         return f"{headline_count} headlines, {self.strip_width}px strip, {block_count} blocks, offset {self.scroll_x}"
 
 # Global scroller instance
@@ -3,6 +3,7 @@
 import sys
 import os
 from typing import Optional
+from PIL import Image
 
 # Add the rpi-rgb-led-matrix library path
 sys.path.append('/home/pi/rpi-rgb-led-matrix/bindings/python')
@@ -22,6 +23,9 @@ class MatrixDisplay:
     def __init__(self):
         self.matrix: Optional[RGBMatrix] = None
         self.canvas = None
+        # Panel size in pixels, fixed by the hardware config
+        self._width = Hardware.COLS * Hardware.CHAIN_LENGTH
+        self._height = Hardware.ROWS * Hardware.PARALLEL
         self._initialize_matrix()
     
     def _initialize_matrix(self) -> None:
@@ -98,9 +102,35 @@ class MatrixDisplay:
             g: Green value (0-255)
             b: Blue value (0-255)
         """
-        if self.canvas and 0 <= x < 64 and 0 <= y < 64:
+        if 0 <= x < self._width and 0 <= y < self._height and self.canvas:
             self.canvas.SetPixel(x, y, r, g, b)
     
+    def set_pixels(self, image: Image.Image, x: int = 0, y: int = 0) -> None:
+        """
+        Set a block of pixels on the canvas in one bulk upload
+        
+        The image is clipped to the panel and pushed with a single SetImage
+        call, instead of one SetPixel call per pixel.
+        
+        Args:
+            image: 'RGB' image holding the pixels (other modes are converted)
+            x, y: Canvas position of the image's top-left corner
+        """
+        if not self.canvas:
+            return
+        
+        # Clip to the panel: unsafe SetImage does no bounds checks of its own
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + image.width, self._width), min(y + image.height, self._height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        if (x0, y0, x1, y1) != (x, y, x + image.width, y + image.height):
+            image = image.crop((x0 - x, y0 - y, x1 - x, y1 - y))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        self.canvas.SetImage(image, x0, y0, unsafe=True)
+    
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, r: int, g: int, b: int) -> None:
         """
         Draw a line on the canvas
@@ -122,11 +152,18 @@ class MatrixDisplay:
             width, height: Rectangle dimensions
             r, g, b: RGB color values
         """
-        if self.canvas:
-            for py in range(y, y + height):
-                for px in range(x, x + width):
-                    if 0 <= px < 64 and 0 <= py < 64:
-                        self.canvas.SetPixel(px, py, r, g, b)
+        if not self.canvas:
+            return
+        
+        # Clip to the panel, then upload the whole block in one SetImage call
+        # instead of one SetPixel call per pixel
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self._width), min(y + height, self._height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        block = Image.new('RGB', (x1 - x0, y1 - y0), (r, g, b))
+        self.canvas.SetImage(block, x0, y0, unsafe=True)
     
     def cleanup(self) -> None:
         """Clean up matrix resources"""
@@ -1,34 +1,92 @@
 # display/renderer.py - Optimized renderer using SetImage with static frame buffer
 
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, FrozenSet
 from PIL import Image, ImageDraw
-from config import Layout, Colors, Fonts, Weather as WeatherConfig
+from config import Layout, Colors, Fonts, Weather as WeatherConfig, HEADLINES_START_Y, HEADLINES_HEIGHT
 from fonts.font_manager import get_font_manager, FontError
 from fonts.bitmap_font import BitmapFontAdapter, get_bitmap_font_manager
 from .headline_scroller import get_headline_scroller
 from display.weather_icons import draw_icon
 
+# Static-buffer areas that are repainted on their own when their content
+# changes, as (left, top, right, bottom) with right/bottom exclusive. Each one
+# lies between the dividers, so a repaint never has to redraw them.
+_DATE_BOX = (0, 0, 64, Layout.DATE_DIVIDER_Y)
+_TIME_BOX = (0, Layout.DATE_DIVIDER_Y + Layout.DATE_DIVIDER_HEIGHT,
+             Layout.ICON_BOX_X, Layout.TIME_DIVIDER_Y)
+_AMPM_BOX = (Layout.ICON_BOX_X, Layout.DATE_DIVIDER_Y + Layout.DATE_DIVIDER_HEIGHT,
+             64, Layout.ICON_BOX_Y)
+_ICON_BOX = (Layout.ICON_BOX_X + 1, Layout.ICON_BOX_Y + 1,
+             64, Layout.TIME_DIVIDER_Y + Layout.TIME_DIVIDER_HEIGHT)
+_STOCKS_BOX = (0, Layout.TIME_DIVIDER_Y + Layout.TIME_DIVIDER_HEIGHT,
+               Layout.VERTICAL_DIVIDER_X, Layout.BOTTOM_DIVIDER_Y)
+_WEATHER_BOX = (Layout.VERTICAL_DIVIDER_X + Layout.VERTICAL_DIVIDER_WIDTH,
+                Layout.TIME_DIVIDER_Y + Layout.TIME_DIVIDER_HEIGHT,
+                64, Layout.BOTTOM_DIVIDER_Y)
+
+# Names of the static regions check_static_content_changed can report
+_ALL_REGIONS = frozenset(('date', 'time', 'ampm', 'weather', 'stocks'))
+
+def _weather_signature(weather_data: Dict[str, Any]) -> Tuple:
+    """The weather fields the display actually draws, for cheap change checks"""
+    return (weather_data.get("high_low_text", "H-- L--"), weather_data.get("current_text", "Now --"),
+            weather_data.get("condition", "cloudy"), weather_data.get("is_night", False))
+
+def _stock_signature(stock_data: Dict[str, Any]) -> Tuple:
+    """The stock fields the display actually draws (change only by sign)"""
+    return (stock_data.get("dow_label", "DOW"), stock_data.get("dow_value", "0"),
+            stock_data.get("dow_change", 0) >= 0,
+            stock_data.get("sp_label", "S&P"), stock_data.get("sp_value", "0"),
+            stock_data.get("sp_change", 0) >= 0)
+
 class OptimizedDisplayRenderer:
     """Optimized renderer using PIL compositing and SetImage for maximum performance"""
     
+    __slots__ = ('font_manager', '_image_cache', '_glyph_cache', '_divider_template', 'static_frame_buffer', 'static_buffer_dirty',
+                 '_frame_scratch', '_headline_scratch', '_static_generation', '_frame_key', '_pushed_keys', 'last_date', 'last_time', 'last_ampm', 'last_weather_sig',
+                 'last_stock_sig', 'headline_scroller', 'tiny_font', 'clock_font')
+    
     def __init__(self):
         self.font_manager = get_font_manager()
         self._image_cache: Dict[str, Image.Image] = {}
+        # Single-glyph masks and the AM/PM labels, keyed by font and text. A
+        # small fixed set, so unlike _image_cache it is never pruned.
+        self._glyph_cache: Dict[str, Image.Image] = {}
         
         # Static frame buffer for non-scrolling content
         self.static_frame_buffer: Optional[Image.Image] = None
         self.static_buffer_dirty = True
         
+        # Persistent output frame: holds a copy of the static buffer, and only
+        # the headline rows are redrawn into it each frame
+        self._frame_scratch: Optional[Image.Image] = None
+        # The headline rows on their own, so they can be pushed to the canvas
+        # without the rest of the frame
+        self._headline_scratch = Image.new('RGB', (64, HEADLINES_HEIGHT), (0, 0, 0))
+        
+        # What the output frame shows: (static buffer generation, headline
+        # viewport mask bytes). Identical keys mean identical frames.
+        self._static_generation = 0
+        self._frame_key: Optional[Tuple[int, bytes]] = None
+        # Keys last pushed to the two alternating canvases (older one first)
+        self._pushed_keys: Tuple[Optional[Tuple[int, bytes]], ...] = (None, None)
+        
         # Track last rendered static content to detect changes
         self.last_date = ""
         self.last_time = ""
         self.last_ampm = ""
-        self.last_weather_data = None
-        self.last_stock_data = None
+        self.last_weather_sig: Optional[Tuple] = None
+        self.last_stock_sig: Optional[Tuple] = None
         
         # Get the headline scroller
         self.headline_scroller = get_headline_scroller()
         
+        # Dividers and icon box never change: draw them once and copy the
+        # result as the starting point of every static buffer rebuild
+        self._divider_template = Image.new('RGB', (64, 64), (0, 0, 0))
+        self.draw_dividers(self._divider_template)
+        self.draw_icon_box(self._divider_template)
+        
         # Load fonts
         try:
             self.tiny_font = self.font_manager.get_font(Fonts.TINY_FONT, Fonts.TINY_SIZE)
@@ -36,6 +94,14 @@ class OptimizedDisplayRenderer:
         except FontError as e:
             print(f"Error loading fonts: {e}")
             raise
+        
+        # The clock only ever draws these glyphs; render them up front so a
+        # new minute is just a few pastes
+        for char in "0123456789:":
+            self.get_glyph_image(char, Fonts.CLOCK_FONT)
+        # Likewise the only two AM/PM labels
+        for ampm_text in ("AM", "PM"):
+            self.get_glyph_image(ampm_text, Fonts.TINY_FONT)
     
     def get_text_image(self, text: str, font_type: str, cache_key: Optional[str] = None) -> Optional[Image.Image]:
         """
@@ -47,7 +113,8 @@ class OptimizedDisplayRenderer:
             cache_key: Optional key for caching the image
             
         Returns:
-            PIL Image or None if error
+            'L' image of the text (255 on text pixels, 0 elsewhere) that
+            paste_colored_text uses directly as its mask, or None if error
         """
         # Use cache if key provided and image exists
         if cache_key and cache_key in self._image_cache:
@@ -64,13 +131,14 @@ class OptimizedDisplayRenderer:
                 return None
             
             # Check if this is a BitmapFontAdapter (our bitmap fonts)
+            # The font's 'L' text mask is the paste mask as-is
             if isinstance(font_adapter, BitmapFontAdapter):
-                image = font_adapter.font_manager.create_text_image(text, font_adapter.font_type)
+                image = font_adapter.font_manager.create_text_mask(text, font_adapter.font_type)
             else:
                 # Fallback: Use bitmap font manager directly
                 print(f"Font adapter is not BitmapFontAdapter, using fallback")
                 bitmap_manager = get_bitmap_font_manager()
-                image = bitmap_manager.create_text_image(text, font_type)
+                image = bitmap_manager.create_text_mask(text, font_type)
             
             # Cache if key provided
             if cache_key and image:
@@ -82,6 +150,68 @@ class OptimizedDisplayRenderer:
             print(f"Error creating text image for '{text}': {e}")
             return None
     
+    def get_glyph_image(self, text: str, font_type: str) -> Optional[Image.Image]:
+        """
+        Get the mask for a single character or fixed label (AM/PM) from the
+        never-pruned glyph cache
+        
+        Args:
+            text: Character or label to render
+            font_type: "tiny64_font" or "clock64_font"
+            
+        Returns:
+            'L' image of the text, or None if error
+        """
+        key = f"{font_type}_{text}"
+        image = self._glyph_cache.get(key)
+        if image is None:
+            image = self.get_text_image(text, font_type)
+            if image is not None:
+                self._glyph_cache[key] = image
+        return image
+    
+    def get_number_image(self, text: str, cache_key: str,
+                         font_type: str = Fonts.TINY_FONT) -> Optional[Image.Image]:
+        """
+        Get the image for a changing value (time, temperature, index level)
+        
+        The image is assembled from cached single-character glyphs, so a new
+        value only costs a few pastes instead of rasterising the whole string.
+        Output is identical to get_text_image.
+        
+        Args:
+            text: Value text to render, e.g. "86" or "44,910"
+            cache_key: Key for caching the assembled image
+            font_type: "tiny64_font" or "clock64_font"
+            
+        Returns:
+            'L' image of the text, or None if error
+        """
+        image = self._image_cache.get(cache_key)
+        if image is not None:
+            return image
+        
+        bitmap_manager = get_bitmap_font_manager()
+        width, height = bitmap_manager.get_text_dimensions(text, font_type)
+        if width == 0 or height == 0:
+            return None
+        
+        image = Image.new('L', (width, height), 0)
+        x_pos = 0
+        for char in text:
+            if bitmap_manager.get_char_bitmap(char, font_type) is None:
+                x_pos += 2  # Unknown character: same advance as create_text_image
+                continue
+            
+            glyph = self.get_glyph_image(char, font_type)
+            if glyph is None:
+                return None
+            image.paste(glyph, (x_pos, 0))
+            x_pos += glyph.width + 1
+        
+        self._image_cache[cache_key] = image
+        return image
+    
     def calculate_centered_x(self, text_width: int, section_width: int, section_start_x: int = 0) -> int:
         """
         Calculate X position to center text within a section
@@ -161,24 +291,23 @@ class OptimizedDisplayRenderer:
         
         Args:
             target: Target PIL image
-            text_image: Source text image (white text on black)
+            text_image: Source text image (white text on black); 'L' images
+                from get_text_image are already the mask and used as-is
             x, y: Position to paste
             color: RGB color tuple for the text
         """
         if not text_image:
             return
-            
-        # Create colored version of text
-        colored_text = Image.new('RGB', text_image.size, (0, 0, 0))
-        
-        for py in range(text_image.height):
-            for px in range(text_image.width):
-                pixel = text_image.getpixel((px, py))
-                if pixel != (0, 0, 0):  # Non-black pixel (text)
-                    colored_text.putpixel((px, py), color)
         
-        # Paste onto target
-        target.paste(colored_text, (x, y))
+        # Clear the text box to black, then fill the color through a mask of
+        # the non-black (text) pixels - two C-level calls instead of a
+        # per-pixel loop, with the same result as pasting a recolored copy
+        if text_image.mode == 'L':
+            mask = text_image
+        else:
+            mask = text_image.convert('L').point(lambda v: 255 if v else 0)
+        target.paste((0, 0, 0), (x, y, x + text_image.width, y + text_image.height))
+        target.paste(color, (x, y), mask)
     
     def render_weather(self, frame: Image.Image, weather_data: Dict[str, Any]) -> None:
         """Render weather information with color-coded temperatures"""
@@ -187,6 +316,11 @@ class OptimizedDisplayRenderer:
         
         # Use WEATHER_TEXT_X for starting position (now at x=34 on right side)
         base_x = Layout.WEATHER_TEXT_X
+        # Config values used several times below, read once
+        top_y = Layout.WEATHER_START_Y
+        bottom_y = top_y + 7
+        white = Colors.WHITE
+        tiny_font = Fonts.TINY_FONT
         
         # Split high_low_text into parts: "H86 L57"
         parts = high_low_text.split()
@@ -200,15 +334,15 @@ class OptimizedDisplayRenderer:
                 high_value = high_part[1:]  # "86"
                 
                 # Render "H" in white
-                h_image = self.get_text_image(high_label, Fonts.TINY_FONT, f"weather_h_{high_label}")
+                h_image = self.get_text_image(high_label, tiny_font, f"weather_h_{high_label}")
                 if h_image:
-                    self.paste_colored_text(frame, h_image, base_x, Layout.WEATHER_START_Y, Colors.WHITE)
+                    self.paste_colored_text(frame, h_image, base_x, top_y, white)
                 
                 # Render "86" in orange, positioned after "H"
-                high_value_image = self.get_text_image(high_value, Fonts.TINY_FONT, f"weather_high_{high_value}")
+                high_value_image = self.get_number_image(high_value, f"weather_high_{high_value}")
                 if high_value_image and h_image:
                     high_x = base_x + h_image.width + 1
-                    self.paste_colored_text(frame, high_value_image, high_x, Layout.WEATHER_START_Y, Colors.ORANGE)
+                    self.paste_colored_text(frame, high_value_image, high_x, top_y, Colors.ORANGE)
             
             # Split "L57" into "L" and "57"
             if len(low_part) > 1:
@@ -216,21 +350,21 @@ class OptimizedDisplayRenderer:
                 low_value = low_part[1:]  # "57"
                 
                 # Render low value in blue - right aligned at x=62 (1px gap before right edge)
-                low_value_image = self.get_text_image(low_value, Fonts.TINY_FONT, f"weather_low_{low_value}")
+                low_value_image = self.get_number_image(low_value, f"weather_low_{low_value}")
                 if low_value_image:
                     low_x = 62 - low_value_image.width
-                    self.paste_colored_text(frame, low_value_image, low_x, Layout.WEATHER_START_Y, Colors.BLUE)
+                    self.paste_colored_text(frame, low_value_image, low_x, top_y, Colors.BLUE)
                     
                     # Render "L" in white, positioned before the value
-                    l_image = self.get_text_image(low_label, Fonts.TINY_FONT, f"weather_l_{low_label}")
+                    l_image = self.get_text_image(low_label, tiny_font, f"weather_l_{low_label}")
                     if l_image:
                         l_x = low_x - l_image.width - 1
-                        self.paste_colored_text(frame, l_image, l_x, Layout.WEATHER_START_Y, Colors.WHITE)
+                        self.paste_colored_text(frame, l_image, l_x, top_y, white)
         else:
             # Fallback: render the whole string at start position
-            high_low_image = self.get_text_image(high_low_text, Fonts.TINY_FONT, f"weather_hl_{high_low_text}")
+            high_low_image = self.get_text_image(high_low_text, tiny_font, f"weather_hl_{high_low_text}")
             if high_low_image:
-                self.paste_colored_text(frame, high_low_image, base_x, Layout.WEATHER_START_Y, Colors.BLUE)
+                self.paste_colored_text(frame, high_low_image, base_x, top_y, Colors.BLUE)
         
         # Split current_text into "Now" and "##" parts
         current_parts = current_text.split()
@@ -239,20 +373,20 @@ class OptimizedDisplayRenderer:
             now_value = current_parts[1]  # e.g., "85"
             
             # Render "Now" label at start position in white
-            now_label_image = self.get_text_image(now_label, Fonts.TINY_FONT, f"weather_now_{now_label}")
+            now_label_image = self.get_text_image(now_label, tiny_font, f"weather_now_{now_label}")
             if now_label_image:
-                self.paste_colored_text(frame, now_label_image, base_x, Layout.WEATHER_START_Y + 7, Colors.WHITE)
+                self.paste_colored_text(frame, now_label_image, base_x, bottom_y, white)
             
             # Render temperature value flush right in cyan at x=62
-            now_value_image = self.get_text_image(now_value, Fonts.TINY_FONT, f"weather_value_{now_value}")
+            now_value_image = self.get_number_image(now_value, f"weather_value_{now_value}")
             if now_value_image:
                 value_x = 62 - now_value_image.width
-                self.paste_colored_text(frame, now_value_image, value_x, Layout.WEATHER_START_Y + 7, Colors.CYAN)
+                self.paste_colored_text(frame, now_value_image, value_x, bottom_y, Colors.CYAN)
         else:
             # Fallback: render the whole string at start position
-            current_image = self.get_text_image(current_text, Fonts.TINY_FONT, f"weather_cur_{current_text}")
+            current_image = self.get_text_image(current_text, tiny_font, f"weather_cur_{current_text}")
             if current_image:
-                self.paste_colored_text(frame, current_image, base_x, Layout.WEATHER_START_Y + 7, Colors.CYAN)
+                self.paste_colored_text(frame, current_image, base_x, bottom_y, Colors.CYAN)
     
     def render_stocks(self, frame: Image.Image, stock_data: Dict[str, Any]) -> None:
         """Render stock information with right-aligned values"""
@@ -269,30 +403,66 @@ class OptimizedDisplayRenderer:
         dow_color = Colors.GREEN if dow_change >= 0 else Colors.RED
         sp_color = Colors.GREEN if sp_change >= 0 else Colors.RED
         
+        # Config values used several times below, read once
+        label_x = Layout.STOCKS_START_X
+        top_y = Layout.STOCKS_START_Y
+        bottom_y = top_y + 7
+        white = Colors.WHITE
+        tiny_font = Fonts.TINY_FONT
+        
         # Render DOW - now on LEFT side
-        dow_label_image = self.get_text_image(dow_label, Fonts.TINY_FONT, f"dow_label_{dow_label}")
+        dow_label_image = self.get_text_image(dow_label, tiny_font, f"dow_label_{dow_label}")
         if dow_label_image:
             # Label starts at STOCKS_START_X (x=1)
-            self.paste_colored_text(frame, dow_label_image, Layout.STOCKS_START_X, Layout.STOCKS_START_Y, Colors.WHITE)
+            self.paste_colored_text(frame, dow_label_image, label_x, top_y, white)
         
-        dow_value_image = self.get_text_image(dow_value, Fonts.TINY_FONT, f"dow_value_{dow_value}")
+        dow_value_image = self.get_number_image(dow_value, f"dow_value_{dow_value}")
         if dow_value_image:
             # Value is right-aligned at x=30 (1px gap before vertical divider at x=31)
             value_x = 30 - dow_value_image.width
-            self.paste_colored_text(frame, dow_value_image, value_x, Layout.STOCKS_START_Y, dow_color)
+            self.paste_colored_text(frame, dow_value_image, value_x, top_y, dow_color)
         
         # Render S&P - now on LEFT side
-        sp_label_image = self.get_text_image(sp_label, Fonts.TINY_FONT, f"sp_label_{sp_label}")
+        sp_label_image = self.get_text_image(sp_label, tiny_font, f"sp_label_{sp_label}")
         if sp_label_image:
             # Label starts at STOCKS_START_X (x=1)
-            self.paste_colored_text(frame, sp_label_image, Layout.STOCKS_START_X, Layout.STOCKS_START_Y + 7, Colors.WHITE)
+            self.paste_colored_text(frame, sp_label_image, label_x, bottom_y, white)
         
-        sp_value_image = self.get_text_image(sp_value, Fonts.TINY_FONT, f"sp_value_{sp_value}")
+        sp_value_image = self.get_number_image(sp_value, f"sp_value_{sp_value}")
         if sp_value_image:
             # Value is right-aligned at x=30 (1px gap before vertical divider at x=31)
             value_x = 30 - sp_value_image.width
-            self.paste_colored_text(frame, sp_value_image, value_x, Layout.STOCKS_START_Y + 7, sp_color)
+            self.paste_colored_text(frame, sp_value_image, value_x, bottom_y, sp_color)
 
+    def render_weather_icon(self, frame: Image.Image, weather_data: Dict[str, Any]) -> None:
+        """Render the weather icon inside the icon box, if enabled"""
+        if WeatherConfig.SHOW_ICON:
+            condition = weather_data.get("condition", "cloudy")
+            is_night = weather_data.get("is_night", False)
+            draw_icon(frame, Layout.WEATHER_ICON_X, Layout.WEATHER_ICON_Y, condition, is_night)
+    
+    def render_date(self, frame: Image.Image, date_text: str) -> None:
+        """Render the date centered across the top of the display"""
+        if date_text:
+            date_image = self.get_text_image(date_text, Fonts.TINY_FONT, f"date_{date_text}")
+            if date_image:
+                x_pos = self.calculate_centered_x(date_image.width, 64, 0)
+                self.paste_colored_text(frame, date_image, x_pos, Layout.DATE_START_Y, Colors.CYAN)
+    
+    def render_time(self, frame: Image.Image, time_text: str) -> None:
+        """Render the time in the large clock font"""
+        if time_text:
+            time_image = self.get_number_image(time_text, f"time_{time_text}", Fonts.CLOCK_FONT)
+            if time_image:
+                self.paste_colored_text(frame, time_image, Layout.TIME_START_X, Layout.TIME_START_Y, Colors.RED)
+    
+    def render_ampm(self, frame: Image.Image, ampm_text: str) -> None:
+        """Render the AM/PM marker beside the time"""
+        if ampm_text:
+            ampm_image = self.get_glyph_image(ampm_text, Fonts.TINY_FONT)
+            if ampm_image:
+                self.paste_colored_text(frame, ampm_image, Layout.AMPM_START_X, Layout.AMPM_START_Y, Colors.RED)
+    
     def rebuild_static_frame_buffer(self, time_data: Dict[str, Any], 
                                    weather_data: Dict[str, Any], 
                                    stock_data: Dict[str, Any]) -> None:
@@ -304,42 +474,23 @@ class OptimizedDisplayRenderer:
             weather_data: Weather data dictionary
             stock_data: Stock data dictionary
         """
-        # Create new blank frame
-        frame = Image.new('RGB', (64, 64), (0, 0, 0))
-        
-        # Draw dividers first
-        self.draw_dividers(frame)
-        
-        # Draw icon box
-        self.draw_icon_box(frame)
+        # Start from the pre-drawn dividers and icon box
+        frame = self._divider_template.copy()
         
         # Draw weather icon if enabled
-        if WeatherConfig.SHOW_ICON:
-            condition = weather_data.get("condition", "cloudy")
-            is_night = weather_data.get("is_night", False)
-            draw_icon(frame, Layout.WEATHER_ICON_X, Layout.WEATHER_ICON_Y, condition, is_night)
+        self.render_weather_icon(frame, weather_data)
         
         # Render date
         date_text = time_data.get('date', '')
-        if date_text:
-            date_image = self.get_text_image(date_text, Fonts.TINY_FONT, f"date_{date_text}")
-            if date_image:
-                x_pos = self.calculate_centered_x(date_image.width, 64, 0)
-                self.paste_colored_text(frame, date_image, x_pos, Layout.DATE_START_Y, Colors.CYAN)
+        self.render_date(frame, date_text)
         
         # Render time
         time_text = time_data.get('time', '')
-        if time_text:
-            time_image = self.get_text_image(time_text, Fonts.CLOCK_FONT, f"time_{time_text}")
-            if time_image:
-                self.paste_colored_text(frame, time_image, Layout.TIME_START_X, Layout.TIME_START_Y, Colors.RED)
+        self.render_time(frame, time_text)
         
         # Render AM/PM
         ampm_text = time_data.get('ampm', '')
-        if ampm_text:
-            ampm_image = self.get_text_image(ampm_text, Fonts.TINY_FONT, f"ampm_{ampm_text}")
-            if ampm_image:
-                self.paste_colored_text(frame, ampm_image, Layout.AMPM_START_X, Layout.AMPM_START_Y, Colors.RED)
+        self.render_ampm(frame, ampm_text)
         
         # Render stocks (now on left side)
         self.render_stocks(frame, stock_data)
@@ -355,37 +506,88 @@ class OptimizedDisplayRenderer:
         self.last_date = date_text
         self.last_time = time_text
         self.last_ampm = ampm_text
-        self.last_weather_data = weather_data
-        self.last_stock_data = stock_data
+        self.last_weather_sig = _weather_signature(weather_data)
+        self.last_stock_sig = _stock_signature(stock_data)
+    
+    def repaint_static_regions(self, regions: FrozenSet[str],
+                               time_data: Dict[str, Any], 
+                               weather_data: Dict[str, Any], 
+                               stock_data: Dict[str, Any]) -> None:
+        """
+        Repaint only the changed parts of the static frame buffer
+        
+        Each region is cleared to black and redrawn in place; the dividers,
+        icon box and unchanged regions are left untouched.
+        
+        Args:
+            regions: Region names from check_static_content_changed
+            time_data: Time data dictionary
+            weather_data: Weather data dictionary
+            stock_data: Stock data dictionary
+        """
+        frame = self.static_frame_buffer
+        if frame is None:
+            self.rebuild_static_frame_buffer(time_data, weather_data, stock_data)
+            return
+        
+        if 'date' in regions:
+            self.last_date = time_data.get('date', '')
+            frame.paste(Colors.BLACK, _DATE_BOX)
+            self.render_date(frame, self.last_date)
+        
+        if 'time' in regions:
+            self.last_time = time_data.get('time', '')
+            frame.paste(Colors.BLACK, _TIME_BOX)
+            self.render_time(frame, self.last_time)
+        
+        if 'ampm' in regions:
+            self.last_ampm = time_data.get('ampm', '')
+            frame.paste(Colors.BLACK, _AMPM_BOX)
+            self.render_ampm(frame, self.last_ampm)
+        
+        if 'stocks' in regions:
+            self.last_stock_sig = _stock_signature(stock_data)
+            frame.paste(Colors.BLACK, _STOCKS_BOX)
+            self.render_stocks(frame, stock_data)
+        
+        if 'weather' in regions:
+            self.last_weather_sig = _weather_signature(weather_data)
+            frame.paste(Colors.BLACK, _ICON_BOX)
+            self.render_weather_icon(frame, weather_data)
+            frame.paste(Colors.BLACK, _WEATHER_BOX)
+            self.render_weather(frame, weather_data)
     
     def check_static_content_changed(self, time_data: Dict[str, Any], 
                                     weather_data: Dict[str, Any], 
-                                    stock_data: Dict[str, Any]) -> bool:
+                                    stock_data: Dict[str, Any]) -> FrozenSet[str]:
         """
-        Check if any static content has changed
+        Check which static content has changed
         
         Returns:
-            True if static content needs to be rebuilt
+            Names of the regions that need repainting (empty, and so false,
+            if nothing changed); all of them if there is no buffer yet
         """
         if self.static_frame_buffer is None:
-            return True
+            return _ALL_REGIONS
+        
+        dirty = []
         
         if time_data.get('date', '') != self.last_date:
-            return True
+            dirty.append('date')
         
         if time_data.get('time', '') != self.last_time:
-            return True
+            dirty.append('time')
         
         if time_data.get('ampm', '') != self.last_ampm:
-            return True
+            dirty.append('ampm')
         
-        if weather_data != self.last_weather_data:
-            return True
+        if _weather_signature(weather_data) != self.last_weather_sig:
+            dirty.append('weather')
         
-        if stock_data != self.last_stock_data:
-            return True
+        if _stock_signature(stock_data) != self.last_stock_sig:
+            dirty.append('stocks')
         
-        return False
+        return frozenset(dirty)
     
     def render_frame_as_image(self, time_data: Dict[str, Any], 
                             weather_data: Dict[str, Any], 
@@ -401,11 +603,13 @@ class OptimizedDisplayRenderer:
             news_data: Dictionary with news headlines
             
         Returns:
-            Complete 64x64 PIL Image ready for SetImage()
+            Complete 64x64 PIL Image ready for SetImage(). The same image is
+            reused for every frame; copy it to keep a frame around.
         """
-        # Check if static content needs rebuilding
-        if self.check_static_content_changed(time_data, weather_data, stock_data):
-            self.rebuild_static_frame_buffer(time_data, weather_data, stock_data)
+        # Check if static content needs repainting
+        dirty_regions = self.check_static_content_changed(time_data, weather_data, stock_data)
+        if dirty_regions:
+            self.repaint_static_regions(dirty_regions, time_data, weather_data, stock_data)
             
             # Prune image cache when static content changes
             # This happens every minute (when time changes), so cache won't grow unbounded
@@ -420,12 +624,17 @@ class OptimizedDisplayRenderer:
                 self._image_cache = new_cache
                 
                 print(f"Image cache pruned: removed {removed_count} entries, kept {len(new_cache)}")
+            
+            # Refresh the output frame from the updated static buffer
+            self._static_generation += 1
+            if self._frame_scratch is None:
+                self._frame_scratch = self.static_frame_buffer.copy()
+            else:
+                self._frame_scratch.paste(self.static_frame_buffer, (0, 0))
         
-        # Copy static buffer
-        if self.static_frame_buffer:
-            frame = self.static_frame_buffer.copy()
-        else:
-            frame = Image.new('RGB', (64, 64), (0, 0, 0))
+        # Only the headline rows change between static updates, and the headline
+        # paste below overwrites all of them, so the frame is reused as-is
+        frame = self._frame_scratch
         
         # Update headlines in scroller if changed
         headlines = news_data.get("headlines", [])
@@ -435,12 +644,13 @@ class OptimizedDisplayRenderer:
             else:
                 self.headline_scroller.update_headlines(headlines)
         
-        # Get current headline slice
-        headline_slice = self.headline_scroller.get_display_slice()
-        
-        # Paste headline slice (the only dynamic element each frame)
-        if headline_slice:
-            frame.paste(headline_slice, (0, Layout.HEADLINES_START_Y))
+        # Paste the current headline view (the only dynamic element each frame),
+        # unless the frame already shows exactly this content
+        frame_key = (self._static_generation, self.headline_scroller.get_viewport_key())
+        if frame_key != self._frame_key:
+            self.headline_scroller.paste_display_slice(self._headline_scratch, 0)
+            frame.paste(self._headline_scratch, (0, HEADLINES_START_Y))
+            self._frame_key = frame_key
         
         # Advance scroll for next frame
         self.headline_scroller.advance_scroll()
@@ -464,14 +674,32 @@ class OptimizedDisplayRenderer:
         # Generate complete frame as PIL image
         frame_image = self.render_frame_as_image(time_data, weather_data, stock_data, news_data)
         
-        # Fast bulk transfer; rgbmatrix 0.0.1+ uses image.getim() (Pillow 11 safe)
-        canvas.SetImage(frame_image.convert('RGB'), unsafe=True)
+        # Frames are already RGB; convert() would copy the whole frame every time
+        if frame_image.mode != 'RGB':
+            frame_image = frame_image.convert('RGB')
+        
+        # The caller swaps the two canvases after every render, so this canvas
+        # was last filled two frames ago; skip the upload if it already holds
+        # exactly this frame (e.g. while a blank gap scrolls past)
+        frame_key = self._frame_key
+        canvas_key = self._pushed_keys[0]
+        if canvas_key != frame_key:
+            if canvas_key is not None and canvas_key[0] == frame_key[0]:
+                # Static content on this canvas is current; push only the headline rows
+                canvas.SetImage(self._headline_scratch, 0, HEADLINES_START_Y, unsafe=True)
+            else:
+                # Fast bulk transfer; rgbmatrix 0.0.1+ uses image.getim() (Pillow 11 safe)
+                canvas.SetImage(frame_image, unsafe=True)
+        self._pushed_keys = (self._pushed_keys[1], frame_key)
     
     def clear_cache(self) -> None:
         """Clear the image cache and reset static buffer"""
         self._image_cache.clear()
         self.static_frame_buffer = None
         self.static_buffer_dirty = True
+        self._frame_scratch = None
+        self._frame_key = None
+        self._pushed_keys = (None, None)
 
 # Global renderer instance
 _display_renderer: Optional[OptimizedDisplayRenderer] = None
@@ -4,7 +4,7 @@
 Weather icon bitmap definitions for 64x64 LED matrix display.
 
 Each icon is 8x8 pixels, with each pixel represented by a digit 0-9
-corresponding to a color in the WeatherIconPalette:
+corresponding to a color in config.Colors.WEATHER_PALETTE:
 
 0 = Black/transparent (off)
 1 = White (clouds, snow)
@@ -20,6 +20,11 @@ corresponding to a color in the WeatherIconPalette:
 Icons are stored as lists of 8 strings, each string representing one row.
 """
 
+from functools import lru_cache
+from typing import List, Tuple
+from PIL import Image
+from config import WEATHER_PALETTE_RGB
+
 WEATHER_ICONS = {
     'clear_day': [
         "00044000",
@@ -155,23 +160,6 @@ WEATHER_ICONS = {
 }
 
 
-# Color palette mapping (indices 0-9)
-class WeatherIconPalette:
-    """Color palette for weather icons"""
-    COLORS = {
-        0: (0, 0, 0),         # Black/transparent (off)
-        1: (255, 255, 255),   # White (clouds, snow)
-        2: (200, 200, 200),   # Light gray (cloud highlights)
-        3: (120, 120, 120),   # Medium gray (cloud shadows)
-        4: (255, 220, 0),     # Yellow (sun)
-        5: (255, 160, 0),     # Orange (sun glow, storm warning)
-        6: (60, 120, 220),    # Blue (rain, water)
-        7: (100, 180, 255),   # Light blue (light rain, sky)
-        8: (40, 40, 100),     # Dark blue (night sky)
-        9: (255, 255, 100),   # Pale yellow (moon, lightning)
-    }
-
-
 def get_icon_data(condition: str, is_night: bool = False) -> list:
     """
     Get icon bitmap data for a weather condition
@@ -195,6 +183,33 @@ def get_icon_data(condition: str, is_night: bool = False) -> list:
     return WEATHER_ICONS.get(icon_key, WEATHER_ICONS['cloudy'])
 
 
+def _icon_images(icon_data: List[str]) -> Tuple[Image.Image, Image.Image]:
+    """
+    Convert icon rows into a colored image and its paste mask
+    
+    The digits become an 8-bit index image, colored by the palette as a
+    lookup table in one step, instead of one putpixel per pixel.
+    
+    Args:
+        icon_data: Icon rows as returned by get_icon_data()
+        
+    Returns:
+        Tuple of (RGB icon image, 'L' mask that is 255 on non-transparent pixels)
+    """
+    size = (len(icon_data[0]), len(icon_data))
+    indices = Image.frombytes('L', size, bytes(int(c) for row in icon_data for c in row))
+    mask = indices.point(lambda v: 255 if v else 0)
+    
+    indices.putpalette(WEATHER_PALETTE_RGB)
+    return indices.convert('RGB'), mask
+
+
+@lru_cache(maxsize=24)
+def _build_icon(condition: str, is_night: bool) -> Tuple[Image.Image, Image.Image]:
+    """Colored icon image and paste mask for a condition, built once per combination"""
+    return _icon_images(get_icon_data(condition, is_night))
+
+
 def draw_icon(image, x: int, y: int, condition: str, is_night: bool = False):
     """
     Draw an 8x8 weather icon on a PIL Image
@@ -206,15 +221,10 @@ def draw_icon(image, x: int, y: int, condition: str, is_night: bool = False):
         condition: Weather condition string
         is_night: Whether it's nighttime
     """
-    icon_data = get_icon_data(condition, is_night)
+    icon_image, mask = _build_icon(condition, bool(is_night))
     
-    # Draw each pixel
-    for row_idx, row in enumerate(icon_data):
-        for col_idx, pixel_char in enumerate(row):
-            color_index = int(pixel_char)
-            if color_index > 0:  # Skip 0 (transparent/black)
-                color = WeatherIconPalette.COLORS[color_index]
-                image.putpixel((x + col_idx, y + row_idx), color)
+    # Paste only the non-transparent pixels (0 = transparent/black is skipped)
+    image.paste(icon_image, (x, y), mask)
 
 
 # Valid condition strings that can be passed to get_icon_data() or draw_icon()
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """
 Fetch today's point change for Dow, S&P 500, and Nasdaq using
-FMP's /stable/quote-short endpoint, one request per symbol.
+FMP's /stable/quote-short endpoint, one request per symbol
+(the requests run concurrently).
 
 API key is hard-coded below for simplicity.
 """
 
 import json
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 API_KEY = "mSfv65dpPcaXHOWPJnGEXtu9HDOkzYVQ"   # <--- your key here
 
@@ -28,8 +30,11 @@ def get_quote(symbol: str):
     return data[0] if data else {}
 
 def main():
-    for sym, label in SYMBOLS.items():
-        q = get_quote(sym)
+    # Overlap the network round-trips instead of waiting on each in turn
+    with ThreadPoolExecutor(max_workers=len(SYMBOLS)) as executor:
+        quotes = list(executor.map(get_quote, SYMBOLS))
+
+    for (sym, label), q in zip(SYMBOLS.items(), quotes):
         change = q.get("change", 0)
         sign = "+" if change >= 0 else ""
         print(f"{label} {sign}{int(round(change))}")
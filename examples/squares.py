@@ -14,7 +14,8 @@ import time
 import signal
 import sys
 
-from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics # type: ignore
+from PIL import Image, ImageDraw
+from rgbmatrix import RGBMatrix, RGBMatrixOptions # type: ignore
 
 # ---------- Config you can tweak ----------
 PANEL_ROWS = 64         # Your panel height
@@ -74,6 +75,11 @@ def main():
     canvas.Fill(0, 0, 0)
     canvas = matrix.SwapOnVSync(canvas)
 
+    # Squares are drawn into one persistent image that is pushed to the
+    # canvas in a single SetImage call per frame (no per-pixel SetPixel)
+    frame_img = Image.new("RGB", (PANEL_COLS, PANEL_ROWS), (0, 0, 0))
+    draw = ImageDraw.Draw(frame_img)
+
     frame = 0
     frame_time = 1.0 / float(FPS)
 
@@ -83,7 +89,7 @@ def main():
 
             # Optionally clear every N frames
             if CLEAR_EVERY_N_FRAMES and frame % CLEAR_EVERY_N_FRAMES == 0 and frame != 0:
-                canvas.Clear()
+                draw.rectangle([0, 0, PANEL_COLS - 1, PANEL_ROWS - 1], fill=(0, 0, 0))
 
             # Draw a handful of random filled squares
             for _ in range(SQUARES_PER_FRAME):
@@ -97,25 +103,17 @@ def main():
                 g = random.randint(0, 255)
                 b = random.randint(0, 255)
 
-                # Filled square: simple pixel fill is fastest without PIL
+                # Filled square with a 1px black border for definition
                 x2 = x + size - 1
                 y2 = y + size - 1
                 # Clamp just in case
                 x2 = clamp(x2, 0, PANEL_COLS - 1)
                 y2 = clamp(y2, 0, PANEL_ROWS - 1)
 
-                for yy in range(y, y2 + 1):
-                    for xx in range(x, x2 + 1):
-                        canvas.SetPixel(xx, yy, r, g, b)
-
-                # (Optional) draw a 1px border around it for definition
-                color = graphics.Color(0, 0, 0)
-                graphics.DrawLine(canvas, x, y, x2, y, color)
-                graphics.DrawLine(canvas, x, y, x, y2, color)
-                graphics.DrawLine(canvas, x2, y, x2, y2, color)
-                graphics.DrawLine(canvas, x, y2, x2, y2, color)
+                draw.rectangle([x, y, x2, y2], fill=(r, g, b), outline=(0, 0, 0))
 
-            # Swap buffers on vsync to avoid tearing
+            # Push the whole frame at once, then swap buffers on vsync to avoid tearing
+            canvas.SetImage(frame_img, unsafe=True)
             canvas = matrix.SwapOnVSync(canvas)
             frame += 1
 
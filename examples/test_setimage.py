@@ -79,16 +79,16 @@ def test_setimage():
         print("\nFalling back to SetPixel test...")
         start_time = time.time()
         
-        for y in range(64):
-            for x in range(64):
-                pixel = test_image.getpixel((x, y))
-                if isinstance(pixel, tuple) and len(pixel) >= 3:
-                    r, g, b = pixel[:3]
-                elif isinstance(pixel, int) or isinstance(pixel, float):
-                    r = g = b = int(pixel)
-                else:
-                    r = g = b = 0
-                canvas.SetPixel(x, y, r, g, b)
+        # Pull the whole frame out of PIL in one bulk read instead of a
+        # getpixel() call (and type check) per pixel
+        width, height = test_image.size
+        data = test_image.convert('RGB').tobytes()
+        set_pixel = canvas.SetPixel
+        i = 0
+        for y in range(height):
+            for x in range(width):
+                set_pixel(x, y, data[i], data[i + 1], data[i + 2])
+                i += 3
         
         elapsed = time.time() - start_time
         print(f"  SetPixel for full frame: {elapsed*1000:.2f}ms")
@@ -4,6 +4,29 @@ import os
 from typing import Dict, List, Tuple, Optional
 from PIL import Image
 
+# Directory the font .txt files live in (next to this module)
+_FONT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _glyph_mask(bitmap: List[str]) -> Image.Image:
+    """
+    Build the 'L' mask (255 on lit pixels) for one glyph
+    
+    Each '0'/'1' row is a base-2 number, so it is packed into an integer and
+    written as a left-aligned, byte-padded row of a 1-bit image - the layout
+    PIL's '1' mode expects - rather than expanded pixel by pixel.
+    
+    Args:
+        bitmap: Glyph rows of equal length, e.g. ['010', '111']
+        
+    Returns:
+        'L' image the size of the glyph
+    """
+    width = len(bitmap[0])
+    row_bytes = (width + 7) // 8
+    pad = row_bytes * 8 - width
+    packed = b''.join((int(row, 2) << pad).to_bytes(row_bytes, 'big') for row in bitmap)
+    return Image.frombytes('1', (width, len(bitmap)), packed).convert('L')
 
 
 class BitmapFontManager:
@@ -26,7 +49,11 @@ class BitmapFontManager:
         # Change: Now stores multiple fonts
         self.font_data: Dict[str, Dict[str, List[str]]] = {}  # font_type -> char -> bitmap
         self.fonts_loaded: Dict[str, bool] = {}  # track which fonts are loaded
-        self.descenders = ['g', 'j', 'p', 'q', 'y']  # Characters with descenders
+        # font_type -> char -> 'L' mask (255 on lit pixels), built once at load
+        self.glyph_masks: Dict[str, Dict[str, Image.Image]] = {}
+        # font_type -> char -> (width, height), so measuring text is a lookup
+        self.char_dims: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self.descenders = frozenset('gjpqy')  # Characters with descenders
         
     def load_font(self, font_type: str = "tiny64_font") -> bool:
         """Load the bitmap font data from file"""
@@ -34,33 +61,47 @@ class BitmapFontManager:
             return True
             
         try:
-            # Get the directory of the current file
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            font_filename = f"{font_type}.txt"
-            font_path = os.path.join(current_dir, font_filename)
+            font_path = os.path.join(_FONT_DIR, f"{font_type}.txt")
             
-            # Initialize the font data dictionary for this font type
-            if font_type not in self.font_data:
-                self.font_data[font_type] = {}
+            # Build the tables locally and publish them together once the
+            # whole file has parsed, so font_data only ever holds full fonts
+            glyphs: Dict[str, List[str]] = {}
+            glyph_masks: Dict[str, Image.Image] = {}
+            char_dims: Dict[str, Tuple[int, int]] = {}
             
+            # The files are a few KB: read in one go and split in memory
             with open(font_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    # Split the line into parts
-                    parts = line.split(',')
-                    if len(parts) < 2:
-                        continue
-                    
-                    # First part is the character
-                    char = parts[0]
-                    # Remaining parts are the bitmap rows
-                    bitmap = parts[1:]
+                lines = f.read().splitlines()
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
                     
-                    self.font_data[font_type][char] = bitmap
+                # Split the line into parts
+                parts = line.split(',')
+                if len(parts) < 2:
+                    continue
+                
+                # First part is the character
+                char = parts[0]
+                # Remaining parts are the bitmap rows
+                bitmap = parts[1:]
+                
+                # The line for ',' itself splits into an empty character
+                # and an empty first row; it can't be looked up, skip it
+                if not char or not bitmap[0]:
+                    continue
+                
+                glyphs[char] = bitmap
+                
+                # Rasterise the glyph once so drawing it is a single paste
+                char_dims[char] = (len(bitmap[0]), len(bitmap))
+                glyph_masks[char] = _glyph_mask(bitmap)
             
+            self.glyph_masks[font_type] = glyph_masks
+            self.char_dims[font_type] = char_dims
+            self.font_data[font_type] = glyphs
             self.fonts_loaded[font_type] = True
             return True
             
@@ -76,46 +117,44 @@ class BitmapFontManager:
     
     def get_char_bitmap(self, char: str, font_type: str = "tiny64_font") -> Optional[List[str]]:
         """Get the bitmap data for a character"""
-        if not self.ensure_font_loaded(font_type) or not char:
-            return None
+        glyphs = self.font_data.get(font_type)
+        if glyphs is None:
+            # First use of this font: load it (font_data is only set on success)
+            if not self.load_font(font_type):
+                return None
+            glyphs = self.font_data[font_type]
             
         # Return the bitmap data if the character exists
-        return self.font_data.get(font_type, {}).get(char)
+        return glyphs.get(char)
     
     def get_char_dimensions(self, char: str, font_type: str = "tiny64_font") -> Tuple[int, int]:
         """Get the width and height of a character"""
-        bitmap = self.get_char_bitmap(char, font_type)
-        if not bitmap:
-            # Default to a space character (typically 2x5)
+        if not self.ensure_font_loaded(font_type):
             return (2, 5)
-            
-        # Width is determined by the actual width of the bitmap
-        width = len(bitmap[0])
-        height = len(bitmap)
         
-        return (width, height)
+        # Unknown characters default to a space character (typically 2x5)
+        return self.char_dims[font_type].get(char, (2, 5))
     
     def get_text_dimensions(self, text: str, font_type: str = "tiny64_font") -> Tuple[int, int]:
         """Calculate the dimensions of a complete text string"""
         if not text or not self.ensure_font_loaded(font_type):
             return (0, 0)
             
-        total_width = 0
+        # Spacing between characters (none after the last one)
+        total_width = len(text) - 1
         max_height = 5  # Default height
+        char_dims = self.char_dims[font_type]
         
-        for i, char in enumerate(text):
-            width, height = self.get_char_dimensions(char, font_type)
+        for char in text:
+            width, height = char_dims.get(char, (2, 5))
             total_width += width
-            max_height = max(max_height, height)
-            
-            # Add spacing between characters (except after the last one)
-            if i < len(text) - 1:
-                total_width += 1
+            if height > max_height:
+                max_height = height
         
         return (total_width, max_height)
 
-    def create_text_image(self, text: str, font_type: str = "tiny64_font") -> Optional[Image.Image]:
-        """Create a PIL Image from the bitmap font data for the given text"""
+    def create_text_mask(self, text: str, font_type: str = "tiny64_font") -> Optional[Image.Image]:
+        """Create an 'L' mask of the text: 255 on lit pixels, 0 elsewhere"""
         if not text or not self.ensure_font_loaded(font_type):
             return None
             
@@ -124,37 +163,38 @@ class BitmapFontManager:
         if width == 0 or height == 0:
             return None
             
-        # Create a new blank image
-        img = Image.new('RGB', (width, height), color=(0, 0, 0))
+        # Create a new blank mask
+        mask_img = Image.new('L', (width, height), 0)
         
         # Position for drawing the next character
         x_pos = 0
+        glyph_masks = self.glyph_masks[font_type]
         
         for char in text:
-            bitmap = self.get_char_bitmap(char, font_type)
-            if not bitmap:
+            mask = glyph_masks.get(char)
+            if mask is None:
                 # Skip unknown characters
                 x_pos += 2  # Default width + spacing
                 continue
-                
-            char_width = len(bitmap[0])
-            char_height = len(bitmap)
             
-            # Determine vertical position (handle descenders)
-            y_offset = 0
-            if char in self.descenders:
-                y_offset = 0
-            
-            # Draw the character
-            for y, row in enumerate(bitmap):
-                for x, pixel in enumerate(row):
-                    if pixel == '1':
-                        img.putpixel((x_pos + x, y_offset + y), (255, 255, 255))
+            # Descender glyphs carry their own tail rows, so every glyph sits
+            # on the top edge. Glyph boxes never overlap, so a plain copy of
+            # the glyph is enough.
+            mask_img.paste(mask, (x_pos, 0))
             
             # Move to the next character position
-            x_pos += char_width + 1  # Add spacing
+            x_pos += mask.width + 1  # Add spacing
+        
+        return mask_img
+    
+    def create_text_image(self, text: str, font_type: str = "tiny64_font") -> Optional[Image.Image]:
+        """Create a PIL Image from the bitmap font data for the given text"""
+        mask = self.create_text_mask(text, font_type)
+        if mask is None:
+            return None
         
-        return img
+        # White text on black: every channel is the mask itself
+        return Image.merge('RGB', (mask, mask, mask))
      
     def get_bitmap_font_image(self, text: str, font_size: int = 5) -> Tuple[Image.Image, Tuple[int, int]]:
         """
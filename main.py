@@ -3,12 +3,14 @@
 import sys
 import time
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
-from config import UpdateIntervals
+from config import UpdateIntervals, Fonts
 from data.data_manager import get_data_manager
 from display.matrix import get_matrix_display, cleanup_matrix
 from display.renderer import get_display_renderer
+from fonts.bitmap_font import get_bitmap_font_manager
 from utils.process_lock import get_process_lock
 from utils.wifi_status import (
     is_wifi_connected,
@@ -24,8 +26,15 @@ class LEDClock:
     
     def __init__(self):
         self.running = False
-        self.data_manager = get_data_manager()
-        self.matrix_display = get_matrix_display()
+        
+        # Parse the bitmap fonts in the background while the data manager and
+        # matrix hardware initialise, so the renderer finds them loaded
+        bitmap_fonts = get_bitmap_font_manager()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="font-load") as executor:
+            executor.submit(bitmap_fonts.load_font, Fonts.TINY_FONT)
+            executor.submit(bitmap_fonts.load_font, Fonts.CLOCK_FONT)
+            self.data_manager = get_data_manager()
+            self.matrix_display = get_matrix_display()
         self.renderer = get_display_renderer()
         
         # Track last rendered state to minimize unnecessary redraws
@@ -33,12 +42,19 @@ class LEDClock:
         self.last_weather_data = None
         self.last_stock_data = None
         self.last_news_data = None
+        # Offline headline dict, kept until its text changes so the identity
+        # check in should_update_display still holds while WiFi is down
+        self.wifi_news_data = None
         self.wifi_was_connected = is_wifi_connected()
         
         # Frame-based scroll timing
         self.frame_count = 0
         self.scroll_every_n_frames = 4  # Scroll every frame for maximum speed
                                         # Set to 2 for half speed, 3 for third speed, etc.
+        # Fixed loop period: scrolling runs at a steady 4 ms * 4 frames =
+        # ~62 px/s. The old 3 ms sleep after each frame made the speed vary
+        # with render and vsync time, so this rate is intentionally fixed.
+        self.frame_period = 0.004
         
         print("LED Clock initialized successfully")
         print(f"Scroll configuration: Every {self.scroll_every_n_frames} frame(s)")
@@ -75,16 +91,15 @@ class LEDClock:
         if current_time_str != self.last_rendered_time:
             return True
         
-        # Update if weather data has changed (compare dict contents)
-        if weather_data != self.last_weather_data:
+        # The data manager hands out the same dict until a fetch replaces it,
+        # so identity is enough to spot new data without walking the contents
+        if weather_data is not self.last_weather_data:
             return True
             
-        # Update if stock data has changed (compare dict contents)
-        if stock_data != self.last_stock_data:
+        if stock_data is not self.last_stock_data:
             return True
         
-        # Update if news data has changed (compare dict contents)
-        if news_data != self.last_news_data:
+        if news_data is not self.last_news_data:
             return True
         
         return False
@@ -143,7 +158,9 @@ class LEDClock:
         # Simple loop counter for debugging
         loop_count = 0
         update_count = 0
-        start_time = time.time()
+        # Elapsed-time bookkeeping uses the monotonic clock only
+        start_time = time.monotonic()
+        next_frame_time = start_time + self.frame_period
         
         try:
             print(f"DEBUG: Entering main loop at {time.strftime('%H:%M:%S')}")
@@ -154,8 +171,6 @@ class LEDClock:
                 if loop_count % 125 == 0:
                     info = self.renderer.headline_scroller.get_current_headline_info()
                     # print(f"Headlines: {info}")
-                                    
-                current_time = time.time()
                 
                 # Get all current data (non-blocking, uses cached data)
                 all_data = self.data_manager.get_current_data()
@@ -168,12 +183,15 @@ class LEDClock:
                 wifi_connected = is_wifi_connected()
                 if not wifi_connected:
                     wifi_headlines = get_wifi_status_headlines()
-                    news_data = {
-                        "headlines": wifi_headlines,
-                        "count": len(wifi_headlines),
-                        "replace_headlines": True,
-                    }
+                    if self.wifi_news_data is None or wifi_headlines != self.wifi_news_data["headlines"]:
+                        self.wifi_news_data = {
+                            "headlines": wifi_headlines,
+                            "count": len(wifi_headlines),
+                            "replace_headlines": True,
+                        }
+                    news_data = self.wifi_news_data
                 elif not self.wifi_was_connected:
+                    self.wifi_news_data = None
                     refresh_wifi_status()
                     ssid = get_active_wifi_name() or "WiFi"
                     print(f"WiFi connected ({ssid}) — resuming news headlines")
@@ -197,14 +215,23 @@ class LEDClock:
                 
                 # Performance logging every 125 loops with actual timing
 #                if loop_count % 125 == 0:
-#                    elapsed = current_time - start_time
+#                    elapsed = time.monotonic() - start_time
 #                    actual_fps = loop_count / elapsed if elapsed > 0 else 0
 #                    update_rate = (update_count / loop_count) * 100 if loop_count > 0 else 0
 #                    scroll_fps = actual_fps * (update_count / loop_count) if loop_count > 0 else 0
 #                    print(f"DEBUG [{time.strftime('%H:%M:%S')}]: Loop {loop_count} | Updates: {update_count} ({update_rate:.1f}%) | Elapsed: {elapsed:.1f}s | Actual FPS: {actual_fps:.1f} | Scroll: ~{scroll_fps:.1f} px/s | Running: {self.running}")
                 
-                # Minimal sleep to prevent CPU spinning
-                time.sleep(0.003)
+                # Sleep until this frame's deadline instead of a fixed 3 ms on
+                # top of however long the frame took
+                sleep_time = next_frame_time - time.monotonic()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                    next_frame_time += self.frame_period
+                else:
+                    # Behind schedule (e.g. a slow vsync): restart the schedule
+                    # one period from now rather than running the following
+                    # frames back to back to catch up, which stutters the scroll
+                    next_frame_time = time.monotonic() + self.frame_period
                 
         except KeyboardInterrupt:
             print("\nKeyboard interrupt received")
@@ -213,7 +240,7 @@ class LEDClock:
             import traceback
             traceback.print_exc()
         finally:
-            total_elapsed = time.time() - start_time
+            total_elapsed = time.monotonic() - start_time
             actual_fps = loop_count / total_elapsed if total_elapsed > 0 else 0
             print(f"DEBUG: Exiting at {time.strftime('%H:%M:%S')} - Loops: {loop_count}, Updates: {update_count}, Total time: {total_elapsed:.1f}s, Actual FPS: {actual_fps:.1f}")
             self.cleanup()
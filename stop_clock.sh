@@ -12,5 +12,4 @@ if sudo systemctl is-active --quiet ledclock.service; then
     exit 1
 else
     echo "LED Clock stopped successfully."
-    echo "Lock file cleaned: /tmp/led_clock.pid"
 fi
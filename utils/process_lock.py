@@ -2,6 +2,7 @@
 
 import os
 import sys
+import fcntl
 import atexit
 from typing import Optional
 
@@ -17,89 +18,77 @@ class ProcessLock:
         """
         self.lockfile_path = lockfile_path
         self.locked = False
-    
-    def is_process_running(self, pid: int) -> bool:
-        """
-        Check if a process with given PID is running
-        
-        Args:
-            pid: Process ID to check
-            
-        Returns:
-            bool: True if process is running, False otherwise
-        """
-        try:
-            # Sending signal 0 checks if process exists without actually signaling it
-            os.kill(pid, 0)
-            return True
-        except OSError:
-            return False
+        # Descriptor the flock is held on while locked
+        self._fd: Optional[int] = None
     
     def acquire(self) -> bool:
         """
         Acquire the process lock
         
+        The lock is an flock() held on the open lock file for the life of the
+        process. The kernel drops it when the process exits, however it exits,
+        so a leftover file from a crashed run never blocks a restart.
+        
         Returns:
             bool: True if lock acquired successfully, False if another instance is running
         """
-        # Check if lock file exists
-        if os.path.exists(self.lockfile_path):
-            try:
-                with open(self.lockfile_path, 'r') as f:
-                    old_pid = int(f.read().strip())
-                
-                # Check if the process is still running
-                if self.is_process_running(old_pid):
-                    print(f"ERROR: Another instance is already running (PID: {old_pid})")
-                    print(f"Lock file: {self.lockfile_path}")
-                    print(f"To force start, stop the other instance or remove the lock file:")
-                    print(f"  sudo kill {old_pid}")
-                    print(f"  # or")
-                    print(f"  rm {self.lockfile_path}")
-                    return False
-                else:
-                    # Stale lock file (process not running), remove it
-                    print(f"Removing stale lock file (old PID: {old_pid})")
-                    os.remove(self.lockfile_path)
-            except (ValueError, IOError) as e:
-                print(f"Warning: Could not read lock file: {e}")
-                print(f"Removing invalid lock file")
-                try:
-                    os.remove(self.lockfile_path)
-                except:
-                    pass
-        
-        # Create new lock file with current PID
         try:
-            with open(self.lockfile_path, 'w') as f:
-                f.write(str(os.getpid()))
-            
-            self.locked = True
-            
-            # Register cleanup on exit
-            atexit.register(self.release)
-            
-            print(f"Process lock acquired (PID: {os.getpid()})")
-            return True
-            
-        except IOError as e:
+            fd = os.open(self.lockfile_path, os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError as e:
             print(f"ERROR: Could not create lock file: {e}")
             return False
+        
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Held by a live process; its PID is in the file for the message
+            try:
+                old_pid = os.read(fd, 32).decode().strip() or "unknown"
+            except (OSError, UnicodeDecodeError):
+                old_pid = "unknown"
+            os.close(fd)
+            print(f"ERROR: Another instance is already running (PID: {old_pid})")
+            print(f"Lock file: {self.lockfile_path}")
+            print(f"To force start, stop the other instance:")
+            print(f"  sudo kill {old_pid}")
+            return False
+        except OSError as e:
+            os.close(fd)
+            print(f"ERROR: Could not lock {self.lockfile_path}: {e}")
+            return False
+        
+        # Record our PID for the error message above and for the shell scripts
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        
+        self._fd = fd
+        self.locked = True
+        
+        # Register cleanup on exit
+        atexit.register(self.release)
+        
+        print(f"Process lock acquired (PID: {os.getpid()})")
+        return True
     
     def release(self) -> None:
-        """Release the process lock by removing the lock file"""
-        if self.locked and os.path.exists(self.lockfile_path):
-            try:
-                # Verify this is our lock file
-                with open(self.lockfile_path, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                if pid == os.getpid():
-                    os.remove(self.lockfile_path)
-                    print(f"Process lock released")
-                    self.locked = False
-            except Exception as e:
-                print(f"Warning: Could not remove lock file: {e}")
+        """Release the process lock"""
+        if not self.locked or self._fd is None:
+            return
+        # The lock file is left in place: unlinking it would let one instance
+        # lock the orphaned inode while another locks a new file at the same
+        # path. Clearing the PID is enough; the next acquire rewrites it.
+        try:
+            os.ftruncate(self._fd, 0)
+        except OSError:
+            pass
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
+        self.locked = False
+        print(f"Process lock released")
     
     def __enter__(self):
         """Context manager entry"""
@@ -0,0 +1,17 @@
+# utils/rounding.py - Rounding rule shared by the data providers
+
+
+def round_half_away(value: float) -> int:
+    """
+    Round to the nearest integer, halves away from zero
+    
+    Python's round() sends halves to the nearest even number (2.5 -> 2), which
+    reads oddly on the display; this gives 2.5 -> 3 and -2.5 -> -3.
+    
+    Args:
+        value: Number to round
+        
+    Returns:
+        The rounded integer
+    """
+    return int(value + (0.5 if value >= 0 else -0.5))